@@ -29,11 +29,14 @@ import asyncio
 import atexit
 import board
 import busio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import digitalio
 import locale
+import logging
 import os
 import pwmio
+import random
 import signal
 import socket
 import sqlite3
@@ -251,6 +254,17 @@ class ControlPanel(MDApp):
         self._dir = os.path.dirname(__file__)
         self.developer_mode = developer_mode
         self.startup_screen = startup_screen
+        # Single background worker for hourly maintenance (log archive, DB cleanup)
+        # so file and database I/O never blocks the Kivy main thread
+        self._maint_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='Maintenance')
+        self._archive_in_flight = False
+        self._cleanup_in_flight = False
+        # Set once the maintenance components exist (see build()); checked every tick
+        self._has_log_archiver = False
+        self._has_cleaners = False
+        # Bumped whenever an alarm input (the parsed pressure) changes, so
+        # AlarmManager can skip sweeps while nothing has moved
+        self.input_version = 0
         # Log initialization with timestamp and developer mode status
         Logger.debug(
             f'Application: {self.dt()} | {self.developer_mode}'
@@ -364,6 +378,7 @@ class ControlPanel(MDApp):
             table_name="sys",
             config=self.config
         ))
+        self._has_cleaners = bool(self.notifications_cleaners)
 
     def run_stabilize_pi(self):
         '''Run the stabilize_pi script if 24 hours have elapsed since last run.'''
@@ -405,6 +420,7 @@ class ControlPanel(MDApp):
             log_path=logfile_path,
             config=self.config
         )
+        self._has_log_archiver = self.log_archiver is not None
         
         # Initialize hardware I/O manager
         self.io = IOManager()
@@ -501,6 +517,13 @@ class ControlPanel(MDApp):
             Clock.schedule_interval(method, interval)
         Clock.schedule_once(self.language_handler.check_all_screens, 0)
         
+        # Run DB cleanup hourly on its own schedule, phase-shifted by a random
+        # offset so it never lands in the same frame as the hourly log archive
+        Clock.schedule_once(
+            lambda dt: Clock.schedule_interval(self.cleanup_db, 60*60),
+            random.uniform(5*60, 30*60)
+        )
+        
         # Schedule stabilize_pi check after UI is initialized
         Clock.schedule_once(lambda dt: self.run_stabilize_pi(), 5)
         
@@ -541,7 +564,7 @@ class ControlPanel(MDApp):
     def hourly_updates(self, *args):
         '''Group all hourly maintenance tasks.'''
         self.archive_log_file()
-        self.cleanup_db()
+        # cleanup_db has its own staggered hourly schedule (see set_update_intervals)
         self.run_stabilize_pi()
 
     def _validate_shutdown_relay(self):
@@ -594,7 +617,6 @@ class ControlPanel(MDApp):
 
     def _setup_periodic_updates(self):
         '''Initialize state and set up periodic updates'''
-        self.alarm_list_last_check = set()
         self.get_pressure()
         self.get_datetime()
         self.set_update_intervals()
@@ -734,12 +756,11 @@ class ControlPanel(MDApp):
             if test_screen:
                 test_screen.toggle_debug()
         # Save all threshold defaults to database
-        for key, value in pressure_defaults.items():
-            self.thresholds_db.add_setting(key, value)
-        for key, value in cycle_defaults.items():
-            self.thresholds_db.add_setting(key, value)
-        for key, value in interface_defaults.items():
-            self.thresholds_db.add_setting(key, value)
+        self.thresholds_db.add_settings_many(
+            [*pressure_defaults.items(), *cycle_defaults.items(), *interface_defaults.items()]
+        )
+        # Alarm conditions cache thresholds briefly; make them pick up the defaults now
+        self.alarm_manager.repository.invalidate_threshold()
         # Load alarm settings
         self.profile_handler.load_alarms()
         Logger.info('Application: Restored all default settings.')
@@ -1073,6 +1094,14 @@ class ControlPanel(MDApp):
 
     def update_pressure_ui(self, current_pressure, *args):
         '''Update the pressure on the UI.'''
+        # Parse once here so alarm conditions can read the float directly
+        try:
+            pressure = float(current_pressure)
+        except (TypeError, ValueError):
+            pressure = -99.9
+        if pressure != getattr(self, '_current_pressure_float', None):
+            self._current_pressure_float = pressure
+            self.input_version += 1
         if self.language == 'EN':
             self.current_pressure = f'{current_pressure} IWC'
         else:
@@ -1522,9 +1551,9 @@ class ControlPanel(MDApp):
         sheet.drawer_type = 'modal'
         sheet.set_state('toggle')
 
-    def check_alarms(self, *args):
+    def check_alarms(self, *args, force=False):
         '''Check for active alarms and update the alarm property.'''
-        self.alarm_manager.check_alarms()
+        self.alarm_manager.check_alarms(force=force)
         active_alarms = set(self.alarm_manager.get_active_alarms())
         self.alarm = bool(active_alarms)
         if not self.alarm and self.shutdown:
@@ -1542,19 +1571,15 @@ class ControlPanel(MDApp):
             # Toggle shutdown state off and return to Main screen
             self.toggle_shutdown(False)
             self.switch_screen('Main')
-        new_alarms = active_alarms - self.alarm_list_last_check
-        cleared_alarms = self.alarm_list_last_check - active_alarms
-        if new_alarms:
+        if self.alarm_manager.take_added_alarms():
             if not self.alarm_silenced:
                 self.alarm_acknowledge_dialog()
             self.cycle_alarms()
-        self.alarm_list_last_check = active_alarms
         if not self.shutdown:
             if self.test_shutdown_time:
                 self.get_shutdown_time_remaining(self.modified_shutdown_time)
             else:
                 self.get_shutdown_time_remaining()
-        active_alarms = self.get_active_alarm_names()
 
     def set_test_shutdown_time(self, new_time):
         '''Toggle the test shutdown time.'''
@@ -1832,12 +1857,11 @@ class ControlPanel(MDApp):
             if alarm_key not in self.alarm_list:
                 continue
 
-            alarm_time_str = self.alarms_db.get_setting(f'{alarm_key}_start_time', None)
-            if not alarm_time_str:
+            alarm_time = self.alarm_manager.repository.get_start_time(alarm_key)
+            if not alarm_time:
                 self.shutdown_pending = False
                 continue
 
-            alarm_time = datetime.fromisoformat(alarm_time_str)
             time_elapsed = current_time - alarm_time
             time_remaining = timedelta(minutes=shutdown_time) - time_elapsed
 
@@ -1903,6 +1927,8 @@ class ControlPanel(MDApp):
         '''Ensure clean shutdown of all components on exit.'''
         Logger.info('Application: Application exiting, performing cleanup..')
         try:
+            # Stop accepting maintenance jobs; don't block exit on a running one
+            self._maint_pool.shutdown(wait=False, cancel_futures=True)
             try:
                 Logger.debug('Application: Closing all database connections...')
                 DatabaseManager.close_all_connections()
@@ -1946,6 +1972,7 @@ class ControlPanel(MDApp):
             
             # Also clear the 72_hour_shutdown alarm start time
             self.alarms_db.add_setting('72_hour_shutdown_start_time', None)
+            self.alarm_manager.repository.invalidate_cached_state()
             
             # Stop the buzzer and clear the alarm button
             self.io.stop_buzzer()
@@ -1962,7 +1989,8 @@ class ControlPanel(MDApp):
                     shutdown_screen.ids.alarm_container.clear_widgets()
             
             # If currently on the shutdown screen, go back to main screen
-            if hasattr(self, 'sm') and self.sm.current == 'Shutdown':
+            sm = getattr(self, 'sm', None)
+            if sm is not None and sm.current == 'Shutdown':
                 self.switch_screen('Main')
 
     def change_test_mode_duration(self, new_duration):
@@ -1970,35 +1998,77 @@ class ControlPanel(MDApp):
         self.test_run_time = new_duration
 
     def archive_log_file(self, *args):
-        '''Archive the log file if needed.'''
-        if hasattr(self, 'log_archiver'):
-            Logger.debug('Logfile: Starting log archive check...')
-            Logger.debug(f'Logfile: Path: {self.log_archiver.log_path}')
-            Logger.debug(f'Logfile: Archive dir: {self.log_archiver.archive_dir}')
-            Logger.debug(f'Logfile: Max lines: {self.log_archiver.max_lines}')
-            if self.log_archiver.log_path.exists():
-                Logger.debug(f'Logfile: Current line count: {self.log_archiver.count_lines()}')
+        '''Archive the log file if needed (runs on the maintenance worker).'''
+        if self._has_log_archiver:
+            # Skip if the previous archive job has not finished yet
+            if self._archive_in_flight:
+                return
+            self._archive_in_flight = True
+            self._maint_pool.submit(self._do_archive_log_file)
+
+    def _do_archive_log_file(self):
+        '''Worker-thread body of archive_log_file.'''
+        try:
+            # One handler dispatch instead of four; the line count is only taken when it will be logged.
+            # `if __debug__:` blocks are dropped at compile time under `python -O`.
+            if __debug__:
+                if Logger.isEnabledFor(logging.DEBUG):
+                    archiver = self.log_archiver
+                    line_count = archiver.count_lines() if archiver.log_path.exists() else 'n/a'
+                    Logger.debug(
+                        'Logfile: Starting log archive check | Path: %s | Archive dir: %s | Max lines: %d | Current line count: %s',
+                        archiver.log_path, archiver.archive_dir, archiver.max_lines, line_count
+                    )
             archived = self.log_archiver.archive_if_needed()
+        except Exception as e:
+            Logger.error(f'Logfile: Error during log archive: {e}')
+        finally:
+            self._archive_in_flight = False
 
     def cleanup_db(self, *args):
-        '''Clean up old database records.'''
-        if hasattr(self, 'notifications_cleaners'):
-            Logger.debug("Application: Starting database cleanup...")
-            total_deleted = 0
-            for i, cleaner in enumerate(self.notifications_cleaners):
-                Logger.debug(f'Application: Cleaning table {i+1}: {cleaner.table_name}, max records: {cleaner.max_records}')
-                deleted = cleaner.cleanup_table()
-                total_deleted += deleted
-                Logger.debug(f'Application: Records deleted from {cleaner.table_name}: {deleted}')
-            Logger.debug(f'Application: Total records deleted: {total_deleted}')
+        '''Clean up old database records (runs on the maintenance worker).'''
+        if self._has_cleaners:
+            # Skip if the previous cleanup job has not finished yet
+            if self._cleanup_in_flight:
+                return
+            self._cleanup_in_flight = True
+            self._maint_pool.submit(self._do_cleanup_db)
+
+    def _do_cleanup_db(self):
+        '''
+        Worker-thread body of cleanup_db.
 
+        DatabaseManager hands out thread-local connections, so the cleaners
+        automatically use a sqlite connection owned by the worker thread.
+        '''
+        try:
+            # Only touch tables that are over their limit; a no-op DELETE still takes the write lock
+            cleaners = DatabaseCleaner.select_needing_cleanup(self.notifications_cleaners)
+            deleted = DatabaseCleaner.cleanup_tables(cleaners)
+            total_deleted = sum(deleted.values())
+            # One aggregated line per run instead of two per table
+            if __debug__:
+                Logger.debug(
+                    'Application: Database cleanup results: %s | Total records deleted: %d',
+                    [(c.table_name, c.max_records, deleted.get((c.db_manager.db_path, c.table_name), 0))
+                     for c in cleaners],
+                    total_deleted
+                )
+        except Exception as e:
+            Logger.error(f'Application: Error during database cleanup: {e}')
+        finally:
+            self._cleanup_in_flight = False
 
 if __name__ == '__main__':
-    # Set up argument parsing.
-    parser = argparse.ArgumentParser(description='Run the Green Machine Control Panel application.')
-    parser.add_argument('-s', '--screen', type=str, help='The initial screen to display.', default='Main')
-    parser.add_argument('-d', '--developer', action='store_true', help='Enable developer mode.', default=False)
-    args = parser.parse_args()
+    if len(sys.argv) == 1:
+        # Normal kiosk boot passes no flags; skip building the parser entirely.
+        args = argparse.Namespace(screen='Main', developer=False)
+    else:
+        # Set up argument parsing.
+        parser = argparse.ArgumentParser(description='Run the Green Machine Control Panel application.')
+        parser.add_argument('-s', '--screen', type=str, help='The initial screen to display.', default='Main')
+        parser.add_argument('-d', '--developer', action='store_true', help='Enable developer mode.', default=False)
+        args = parser.parse_args()
     # Pass the screen name to the application and set the startup_screen to the argument.
     app = ControlPanel(startup_screen=args.screen, developer_mode=args.developer)
     app.run()
@@ -0,0 +1,26 @@
+'''
+Shared fixtures for the unit tests.
+
+The application imports its packages relative to vst_gm_control_panel/
+(``from utils import ...``), so the tests do the same.
+'''
+
+import os
+import sys
+
+import pytest
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'vst_gm_control_panel')
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+
+@pytest.fixture
+def db_dir(tmp_path, monkeypatch):
+    '''Point every DatabaseManager created during the test at a temporary directory.'''
+    from utils import database_manager
+    monkeypatch.setattr(database_manager, '_BASE_DIR', str(tmp_path))
+    # Worker managers are cached per thread by (db_name, table) and would
+    # still point at the previous test's directory
+    monkeypatch.delattr(database_manager.DatabaseManager._local, 'worker_managers', raising=False)
+    return tmp_path
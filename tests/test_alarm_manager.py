@@ -0,0 +1,176 @@
+'''
+Tests for AlarmManager sweep skipping, interlock probing and the
+added-alarm handoff to the UI.
+'''
+
+import types
+
+import pytest
+
+pytest.importorskip('kivymd')
+
+from utils import alarm_manager
+from utils.alarm_manager import Alarm, AlarmCondition, AlarmManager, AlarmRepository, OverfillCondition
+from utils.database_manager import DatabaseManager
+
+
+class SwitchCondition(AlarmCondition):
+    '''Condition that is met while ``met`` is set, counting how often it is checked.'''
+
+    def __init__(self):
+        self.met = False
+        self.checks = 0
+
+    def check(self, context):
+        self.checks += 1
+        return self.met
+
+
+class FakeIO:
+    def __init__(self):
+        self.stops = 0
+
+    def stop_cycle(self):
+        self.stops += 1
+
+    def set_shutdown_relay(self, *args):
+        pass
+
+
+@pytest.fixture
+def app(db_dir, monkeypatch):
+    app = types.SimpleNamespace(
+        alarms_db=DatabaseManager('app.db', 'alarms'),
+        gm_db=DatabaseManager('app.db', 'gm'),
+        thresholds_db=DatabaseManager('app.db', 'thresholds'),
+        user_db=DatabaseManager('app.db', 'user'),
+        io=FakeIO(),
+        serial_manager=types.SimpleNamespace(esp32_overfill=False),
+        current_pressure='0.0 inHg',
+        input_version=1,
+        shutdown=False,
+    )
+    monkeypatch.setattr(alarm_manager.MDApp, 'get_running_app', staticmethod(lambda: app))
+    monkeypatch.setattr(alarm_manager, '_REPO_SINGLETON', None)
+    AlarmRepository.invalidate_cached_state()
+    AlarmRepository.invalidate_threshold()
+    AlarmRepository.invalidate_profile()
+    yield app
+    AlarmRepository.invalidate_cached_state()
+
+
+@pytest.fixture
+def manager(app):
+    manager = AlarmManager()
+    manager.app = app
+    app.alarm_manager = manager
+    return manager
+
+
+def _add(manager, name, condition, duration=0.0):
+    alarm = Alarm(name, condition, duration)
+    manager.add_alarm(alarm)
+    return alarm
+
+
+def test_sweep_skipped_until_input_version_changes(app, manager):
+    switch = SwitchCondition()
+    _add(manager, 'test_alarm', switch)
+
+    manager.check_alarms()
+    manager.check_alarms()
+    assert switch.checks == 1
+
+    app.input_version += 1
+    manager.check_alarms()
+    assert switch.checks == 2
+
+    manager.check_alarms(force=True)
+    assert switch.checks == 3
+
+
+def test_full_sweep_after_interval_even_without_input_change(app, manager, monkeypatch):
+    switch = SwitchCondition()
+    _add(manager, 'test_alarm', switch)
+    manager.check_alarms()
+
+    monkeypatch.setattr(AlarmManager, '_FULL_SWEEP_INTERVAL', 0.0)
+    manager.check_alarms()
+    assert switch.checks == 2
+
+
+def test_pending_alarm_is_not_skipped(app, manager):
+    switch = SwitchCondition()
+    _add(manager, 'test_alarm', switch, duration=60.0)
+    switch.met = True
+    app.input_version += 1
+    manager.check_alarms()
+
+    manager.check_alarms()
+    assert switch.checks == 2
+
+
+def test_overfill_interlock_evaluated_while_sweep_is_skipped(app, manager):
+    switch = SwitchCondition()
+    _add(manager, 'test_alarm', switch)
+    _add(manager, 'overfill', OverfillCondition())
+    manager.check_alarms()
+    assert manager.active_alarms == set()
+
+    # The flag changes without input_version being bumped
+    app.serial_manager.esp32_overfill = True
+    manager.check_alarms()
+
+    assert 'overfill' in manager.active_alarms
+    assert app.io.stops >= 1
+    # The interlock change fell through to a full sweep
+    assert switch.checks == 2
+
+
+def test_added_alarms_kept_until_the_ui_takes_them(app, manager):
+    switch = SwitchCondition()
+    _add(manager, 'test_alarm', switch)
+    manager.check_alarms()
+    assert manager.take_added_alarms() == frozenset()
+
+    switch.met = True
+    app.input_version += 1
+    manager.check_alarms()
+    # Further sweeps before the UI looks must not drop the new alarm
+    app.input_version += 1
+    manager.check_alarms()
+    manager.check_alarms()
+
+    assert manager.take_added_alarms() == {'test_alarm'}
+    assert manager.take_added_alarms() == frozenset()
+
+
+def test_added_alarm_dropped_if_it_clears_before_the_ui_looks(app, manager):
+    switch = SwitchCondition()
+    _add(manager, 'test_alarm', switch)
+    switch.met = True
+    manager.check_alarms(force=True)
+    switch.met = False
+    manager.check_alarms(force=True)
+
+    assert manager.take_added_alarms() == frozenset()
+
+
+def test_reload_alarm_states_picks_up_direct_database_clear(app, manager):
+    switch = SwitchCondition()
+    alarm = _add(manager, 'vac_pump', switch)
+    switch.met = True
+    manager.check_alarms(force=True)
+    assert alarm.start_time is not None and alarm.time_triggered is not None
+
+    # A screen clears the alarm by writing the database directly
+    app.alarms_db.add_setting('vac_pump_start_time', None)
+    switch.met = False
+    manager.reload_alarm_states(['vac_pump'])
+
+    assert alarm.start_time is None
+    assert alarm.time_triggered is None
+    # The next check is a full sweep even though input_version is unchanged
+    checks = switch.checks
+    manager.check_alarms()
+    assert switch.checks == checks + 1
@@ -0,0 +1,95 @@
+'''
+Tests for the JSON Lines backfill store in utils.data_handler.
+'''
+
+import json
+import os
+
+import pytest
+
+from utils import data_handler
+from utils.data_handler import DataHandler
+
+
+def _records(start, count):
+    return [{'seq': i, 'pressure': i / 10} for i in range(start, start + count)]
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    '''Make DataHandler use <tmp>/data instead of the repository's data directory.'''
+    monkeypatch.setattr(data_handler, '__file__', str(tmp_path / 'pkg' / 'utils' / 'data_handler.py'))
+    path = tmp_path / 'data'
+    path.mkdir()
+    return path
+
+
+def test_backfill_round_trip_and_index(data_dir):
+    handler = DataHandler()
+
+    assert handler.save_backfill_data(_records(0, 6))
+    assert handler.save_backfill_data(_records(6, 4))
+
+    assert handler.get_backfill_data() == _records(0, 10)
+    assert handler.get_backfill_data(limit=3) == _records(7, 3)
+    assert handler.get_backfill_data(limit=50) == _records(0, 10)
+    assert os.path.getsize(handler.backfill_index) == 10 * data_handler._OFFSET.size
+
+
+def test_tail_read_seeks_to_indexed_offset(data_dir):
+    handler = DataHandler()
+    handler.save_backfill_data(_records(0, 5))
+
+    with open(handler.backfill_file, 'rb') as f:
+        lines = f.readlines()
+
+    assert handler._tail_offset(2) == sum(len(line) for line in lines[:3])
+    assert handler._tail_offset(5) == 0
+
+
+def test_short_or_torn_index_still_returns_latest_records(data_dir):
+    handler = DataHandler()
+    handler.save_backfill_data(_records(0, 8))
+
+    # Index missing its last entry (crash between the data and index writes)
+    with open(handler.backfill_index, 'r+b') as idx:
+        idx.truncate(7 * data_handler._OFFSET.size)
+    assert handler.get_backfill_data(limit=3) == _records(5, 3)
+
+    # Torn index entry: the index is ignored and the file is scanned
+    with open(handler.backfill_index, 'ab') as idx:
+        idx.write(b'\x01\x02')
+    assert handler._tail_offset(3) is None
+    assert handler.get_backfill_data(limit=3) == _records(5, 3)
+
+
+def test_legacy_json_backfill_is_migrated(data_dir):
+    legacy = data_dir / 'backfill_data.json'
+    legacy.write_text(json.dumps(_records(0, 4)))
+
+    handler = DataHandler()
+
+    assert not legacy.exists()
+    assert (data_dir / 'backfill_data.json.migrated').exists()
+    assert handler.get_backfill_data() == _records(0, 4)
+    assert handler.get_backfill_data(limit=2) == _records(2, 2)
+
+    # A later start must not migrate again
+    (data_dir / 'backfill_data.json').write_text(json.dumps(_records(100, 1)))
+    assert DataHandler().get_backfill_data() == _records(0, 4)
+
+
+def test_clear_backfill_data_backs_up_both_files(data_dir):
+    handler = DataHandler()
+    handler.save_backfill_data(_records(0, 3))
+
+    assert handler.clear_backfill_data()
+
+    assert handler.get_backfill_data() == []
+    assert os.path.getsize(handler.backfill_index) == 0
+    names = os.listdir(data_dir)
+    assert any(name.startswith('backfill_data.jsonl.backup.') for name in names)
+    assert any(name.startswith('backfill_data.idx.backup.') for name in names)
+
+    handler.save_backfill_data(_records(10, 2))
+    assert handler.get_backfill_data(limit=1) == _records(11, 1)
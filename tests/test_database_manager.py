@@ -0,0 +1,165 @@
+'''
+Tests for utils.database_manager: table migration, setting defaults and
+batched worker writes.
+'''
+
+import logging
+import sqlite3
+import threading
+
+import pytest
+
+from utils.database_manager import DatabaseManager
+
+
+def _table_sql(db, table):
+    return db.execute_query("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?;", (table,))
+
+
+def test_settings_table_migrated_to_without_rowid(db_dir):
+    conn = sqlite3.connect(db_dir / 'app.db')
+    conn.execute('CREATE TABLE gm (id INTEGER PRIMARY KEY, key TEXT, value TEXT);')
+    conn.executemany('INSERT INTO gm (key, value) VALUES (?, ?);', [('a', '1'), ('b', '2'), (None, 'orphan')])
+    conn.commit()
+    conn.close()
+
+    db = DatabaseManager('app.db', 'gm')
+
+    assert 'WITHOUT ROWID' in _table_sql(db, 'gm')
+    assert db.get_all_settings() == {'a': '1', 'b': '2'}
+
+
+def test_translations_migration_keeps_oldest_duplicate(db_dir):
+    conn = sqlite3.connect(db_dir / 'translations.db')
+    conn.execute('CREATE TABLE translations (id INTEGER PRIMARY KEY, language TEXT, key TEXT, value TEXT);')
+    conn.executemany(
+        'INSERT INTO translations (language, key, value) VALUES (?, ?, ?);',
+        [('en', 'hello', 'Hello'), ('en', 'hello', 'Hi'), ('es', 'hello', 'Hola')],
+    )
+    conn.commit()
+    conn.close()
+
+    db = DatabaseManager('translations.db', 'translations')
+
+    assert 'WITHOUT ROWID' in _table_sql(db, 'translations')
+    # translate() returned the lowest-id row before the migration
+    assert db.translate('en', 'hello') == 'Hello'
+    assert db.translate('es', 'hello') == 'Hola'
+    assert db.execute_query('SELECT COUNT(*) FROM translations;') == 2
+
+
+def test_get_setting_stores_missing_default(db_dir):
+    db = DatabaseManager('app.db', 'gm')
+
+    assert db.get_setting('missing', 0) == 0
+    assert db.get_setting('missing', 5) == '0'
+
+
+def test_get_setting_replaces_null_but_keeps_existing_value(db_dir):
+    db = DatabaseManager('app.db', 'gm')
+    db.add_setting('null_key', None)
+    db.add_setting('set_key', 'stored')
+
+    assert db.get_setting('null_key', 'default') == 'default'
+    assert db.get_setting('null_key') == 'default'
+    assert db.get_setting('set_key', 'default') == 'stored'
+
+
+@pytest.mark.skipif(not DatabaseManager._HAS_RETURNING, reason='needs SQLite 3.35+ for RETURNING')
+def test_add_setting_if_missing_returns_row_only_when_written(db_dir):
+    db = DatabaseManager('app.db', 'gm')
+    sql = db._sql['add_setting_if_missing']
+    db.add_setting('existing', 'kept')
+
+    assert db.execute_query(sql, ('new', 'v'), default_value=False) == 'new'
+    assert db.execute_query(sql, ('existing', 'v'), default_value=False) is False
+    assert db.get_setting('existing') == 'kept'
+
+
+def test_batch_runs_in_order_and_fires_callbacks(db_dir):
+    db = DatabaseManager('app.db', 'gm')
+    results = []
+    batch = [
+        (db.add_setting, ('k', '1'), {}, None),
+        (db.add_setting, ('k', '2'), {}, None),
+        (db.get_setting, ('k',), {}, results.append),
+    ]
+
+    DatabaseManager._run_batch(batch, batched=True)
+
+    assert db.get_setting('k') == '2'
+    assert results == ['2']
+
+
+def test_failed_operation_does_not_drop_the_rest_of_the_batch(db_dir, monkeypatch):
+    def fail(self):
+        raise RuntimeError('bad operation')
+
+    monkeypatch.setattr(DatabaseManager, 'fail', fail, raising=False)
+    db = DatabaseManager('app.db', 'gm')
+    done = []
+    batch = [
+        (db.add_setting, ('a', '1'), {}, done.append),
+        (db.fail, (), {}, done.append),
+        (db.add_setting, ('a', '2'), {}, done.append),
+        (db.add_setting, ('b', '1'), {}, done.append),
+    ]
+
+    DatabaseManager._run_batch(batch, batched=True)
+
+    assert db.get_setting('a') == '2'
+    assert db.get_setting('b') == '1'
+    # One callback per operation that succeeded, none from the rolled-back attempt
+    assert done == [None, None, None]
+
+
+def test_batch_that_reads_first_survives_a_concurrent_commit(db_dir, monkeypatch, caplog):
+    '''A write committed by another connection mid-batch must not make the batch lose its write.'''
+    read_done = threading.Event()
+    resume = threading.Event()
+
+    def read_then_write(self, key):
+        self.get_setting('other')
+        read_done.set()
+        resume.wait(1.0)
+        self.add_setting(key, 'batched')
+
+    monkeypatch.setattr(DatabaseManager, 'read_then_write', read_then_write, raising=False)
+    db = DatabaseManager('app.db', 'gm')
+    db.add_setting('other', 'x')
+
+    batch_thread = threading.Thread(
+        target=DatabaseManager._run_batch,
+        args=([(db.read_then_write, ('from_batch',), {}, None)], True),
+    )
+    batch_thread.start()
+    assert read_done.wait(2.0)
+    writer = threading.Thread(target=db.add_setting, args=('from_main', 'direct'))
+    writer.start()
+    writer.join(0.2)
+    resume.set()
+    batch_thread.join(5.0)
+    writer.join(5.0)
+
+    assert db.get_setting('from_batch') == 'batched'
+    assert db.get_setting('from_main') == 'direct'
+    # The batch held the write lock from the start, so it never had to be replayed
+    assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
+
+
+def test_queue_operation_runs_on_the_database_worker(db_dir):
+    db = DatabaseManager('app.db', 'gm')
+    done = threading.Event()
+    seen = []
+
+    def finished(result):
+        seen.append((threading.current_thread().name, result))
+        done.set()
+
+    for i in range(10):
+        DatabaseManager.queue_operation(db.add_setting, 'counter', str(i))
+    DatabaseManager.queue_operation(db.get_setting, 'counter', callback=finished)
+
+    assert done.wait(5.0)
+    assert seen[0][0].startswith('DatabaseWorker-')
+    assert seen[0][1] == '9'
@@ -0,0 +1,115 @@
+'''
+Tests for utils.db_cleaner: the grouped over-limit probe, batched trimming
+with its per-table fallback, and deferred space reclaim.
+'''
+
+import pytest
+
+pytest.importorskip('kivy')
+
+from utils.database_manager import DatabaseManager
+from utils.db_cleaner import DatabaseCleaner
+
+
+@pytest.fixture(autouse=True)
+def pending_deletes(monkeypatch):
+    '''Keep the class-wide pending-delete totals local to each test.'''
+    monkeypatch.setattr(DatabaseCleaner, '_pending_vacuum_deletes', {})
+
+
+def _fill(db, count, start=0):
+    for i in range(start, start + count):
+        db.add_notification(f'2026-01-01 00:00:{i:04d}', f'note {i}')
+
+
+def _count(db):
+    return db.execute_query(f'SELECT COUNT(*) FROM {db.table_name};')
+
+
+def test_select_needing_cleanup_probes_each_table(db_dir):
+    system = DatabaseManager('notifications.db', 'system')
+    user = DatabaseManager('notifications.db', 'user')
+    _fill(system, 12)
+    _fill(user, 3)
+    over = DatabaseCleaner(system, max_records=10)
+    under = DatabaseCleaner(user, max_records=10)
+
+    assert DatabaseCleaner.select_needing_cleanup([over, under]) == [over]
+
+
+def test_select_needing_cleanup_falls_back_when_a_table_is_missing(db_dir):
+    system = DatabaseManager('notifications.db', 'system')
+    _fill(system, 12)
+    over = DatabaseCleaner(system, max_records=10)
+    missing = DatabaseCleaner(system, table_name='sys', max_records=10)
+
+    assert DatabaseCleaner.select_needing_cleanup([over, missing]) == [over]
+
+
+def test_cleanup_tables_keeps_newest_rows(db_dir):
+    system = DatabaseManager('notifications.db', 'system')
+    user = DatabaseManager('notifications.db', 'user')
+    _fill(system, 25)
+    _fill(user, 8)
+    cleaners = [DatabaseCleaner(system, max_records=10), DatabaseCleaner(user, max_records=5)]
+
+    deleted = DatabaseCleaner.cleanup_tables(cleaners)
+
+    assert deleted == {(system.db_path, 'system'): 15, (user.db_path, 'user'): 3}
+    assert _count(system) == 10
+    assert system.execute_query('SELECT MIN(notification) FROM system;') == 'note 15'
+    assert _count(user) == 5
+
+
+def test_cleanup_tables_sums_cleaners_sharing_a_table(db_dir):
+    system = DatabaseManager('notifications.db', 'system')
+    other = DatabaseManager('other_notifications.db', 'system')
+    _fill(system, 100)
+    _fill(other, 30)
+    cleaners = [
+        DatabaseCleaner(system, max_records=20),
+        DatabaseCleaner(system, max_records=10),
+        DatabaseCleaner(other, max_records=25),
+    ]
+
+    deleted = DatabaseCleaner.cleanup_tables(cleaners)
+
+    assert deleted == {(system.db_path, 'system'): 90, (other.db_path, 'system'): 5}
+    assert _count(system) == 10
+
+
+def test_cleanup_tables_falls_back_to_individual_cleanup(db_dir):
+    system = DatabaseManager('notifications.db', 'system')
+    _fill(system, 15)
+    cleaners = [
+        DatabaseCleaner(system, max_records=10),
+        DatabaseCleaner(system, table_name='sys', max_records=10),
+    ]
+
+    deleted = DatabaseCleaner.cleanup_tables(cleaners)
+
+    assert deleted == {(system.db_path, 'system'): 5, (system.db_path, 'sys'): 0}
+    assert _count(system) == 10
+
+
+def test_space_reclaimed_only_past_the_delete_threshold(db_dir, monkeypatch):
+    monkeypatch.setattr(DatabaseCleaner, 'VACUUM_DELETE_THRESHOLD', 50)
+    system = DatabaseManager('notifications.db', 'system')
+    conn = system.get_thread_connection()
+    cleaner = DatabaseCleaner(system, max_records=10)
+
+    _fill(system, 40)
+    DatabaseCleaner.cleanup_tables([cleaner])
+    assert DatabaseCleaner._pending_vacuum_deletes[system.db_path] == 30
+    assert conn.execute('PRAGMA auto_vacuum;').fetchone()[0] == 0
+
+    # Crossing the threshold switches the file to incremental auto-vacuum
+    _fill(system, 30, start=40)
+    DatabaseCleaner.cleanup_tables([cleaner])
+    assert DatabaseCleaner._pending_vacuum_deletes[system.db_path] == 0
+    assert conn.execute('PRAGMA auto_vacuum;').fetchone()[0] == 2
+
+    # Later reclaims release free pages incrementally
+    _fill(system, 2000, start=70)
+    DatabaseCleaner.cleanup_tables([cleaner])
+    assert conn.execute('PRAGMA freelist_count;').fetchone()[0] == 0
@@ -0,0 +1,93 @@
+'''
+Tests for utils.log_archiver: rotating logfile.csv into zip archives and
+retrying staged logs whose compression failed.
+'''
+
+import zipfile
+
+import pytest
+
+pytest.importorskip('kivy')
+
+from utils import log_archiver
+from utils.log_archiver import LogArchiver
+
+HEADER = 'Sequence,Pressure,Current,Mode,Faults,Temp,Date (Local),Time (Local)\n'
+
+
+@pytest.fixture(autouse=True)
+def no_settle_delay(monkeypatch):
+    monkeypatch.setattr(log_archiver, 'STAGING_SETTLE_SECONDS', 0)
+
+
+def _write_log(path, tag, rows=5):
+    with open(path, 'w') as f:
+        f.write(HEADER)
+        for i in range(rows):
+            f.write(f'{tag}{i},1.0,2.0,run,0,20,2026/10/1{i},12:00:0{i}\n')
+
+
+def _archived_rows(archiver):
+    rows = {}
+    for zip_path in sorted(archiver.archive_dir.iterdir()):
+        with zipfile.ZipFile(zip_path) as zf:
+            rows[zip_path.name] = zf.read('logfile.csv').decode().splitlines()
+    return rows
+
+
+@pytest.fixture
+def archiver(tmp_path):
+    archiver = LogArchiver(tmp_path / 'logfile.csv')
+    archiver.max_lines = 3
+    return archiver
+
+
+def test_count_lines_without_trailing_newline(archiver):
+    archiver.log_path.write_text('a\nb\nc')
+    assert archiver.count_lines() == 3
+
+
+def test_archive_if_needed_rotates_full_log(archiver):
+    _write_log(archiver.log_path, 'first')
+
+    assert archiver.archive_if_needed()
+
+    assert archiver.log_path.read_text() == HEADER
+    (rows,) = _archived_rows(archiver).values()
+    assert rows[0] == HEADER.strip()
+    assert rows[1].startswith('first0,') and rows[-1].startswith('first4,')
+    assert not list(archiver.log_path.parent.glob('*' + log_archiver.STAGING_SUFFIX))
+
+
+def test_archive_if_needed_skips_short_log(archiver):
+    _write_log(archiver.log_path, 'short', rows=2)
+    assert not archiver.archive_if_needed()
+    assert not list(archiver.archive_dir.iterdir())
+
+
+def test_failed_compression_is_kept_and_retried(archiver, monkeypatch):
+    _write_log(archiver.log_path, 'first')
+
+    def fail_write(self, *args, **kwargs):
+        raise OSError('disk full')
+
+    with monkeypatch.context() as m:
+        m.setattr(zipfile.ZipFile, 'write', fail_write)
+        assert not archiver.archive_log()
+
+    # No partial zip; the full log is staged and the live log starts over
+    assert not list(archiver.archive_dir.iterdir())
+    (staged,) = archiver.log_path.parent.glob('*' + log_archiver.STAGING_SUFFIX)
+    assert 'first4' in staged.read_text()
+    assert archiver.log_path.read_text() == HEADER
+
+    # The next archive retries the staged log before rotating the new one
+    _write_log(archiver.log_path, 'second')
+    assert archiver.archive_log()
+
+    archived = _archived_rows(archiver)
+    assert len(archived) == 2
+    assert staged.name[:-len(log_archiver.STAGING_SUFFIX)] + '.zip' in archived
+    tags = sorted(rows[1].split(',')[0] for rows in archived.values())
+    assert tags == ['first0', 'second0']
+    assert not staged.exists()
@@ -3,14 +3,52 @@ VST GM Control Panel - Utility Modules
 
 This package contains utility classes and functions for the VST GM Control Panel
 application, including data handling, modem communication, and system management.
+
+Exports are resolved lazily (PEP 562): a submodule is only imported the first
+time one of its names is accessed, so importing the package stays cheap.
 """
 
-# Import and export utility classes that exist
-from .data_handler import DataHandler
-from .modem import SerialManager
+import importlib
+
+# Exported name -> submodule that defines it
+_LAZY = {
+    'AlarmManager': 'alarm_manager',
+    'ColorFormatter': 'color_formatter',
+    'CycleStateManager': 'cycle_state_manager',
+    'DatabaseCleaner': 'db_cleaner',
+    'DatabaseManager': 'database_manager',
+    'DataHandler': 'data_handler',
+    'LanguageHandler': 'language_handler',
+    'LogArchiver': 'log_archiver',
+    'ProfileHandler': 'profile_handler',
+    'SerialManager': 'modem',
+}
 
 # Define __all__ to control what gets imported with "from utils import *"
+# Keep in sync with _LAZY; a star-import resolves (and so imports) every name listed.
 __all__ = [
+    'AlarmManager',
+    'ColorFormatter',
+    'CycleStateManager',
+    'DatabaseCleaner',
+    'DatabaseManager',
     'DataHandler',
-    'SerialManager'
-]
\ No newline at end of file
+    'LanguageHandler',
+    'LogArchiver',
+    'ProfileHandler',
+    'SerialManager',
+]
+
+
+def __getattr__(name):
+    '''Import the defining submodule on first access and cache the export.'''
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -5,7 +5,6 @@ Alarm Manager for VST Green Machine Control Panel.
 # Standard imports
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-import errno
 import logging
 import os
 import shutil
@@ -15,8 +14,58 @@ from typing import Dict, List, Optional, Set, Callable, Any, Union
 
 # Kivy imports
 from kivymd.app import MDApp
+from kivy.clock import Clock
 from kivy.logger import Logger
 
+# In-memory GM fault count, shared by every AlarmRepository instance.
+# Increments and resets happen from Clock callbacks and worker threads.
+_gm_fault_count = 0
+_gm_fault_lock = threading.Lock()
+
+# How long a shutdown-triggering alarm must stay active before the 72-hour shutdown
+_SEVENTY_TWO_HOURS = timedelta(hours=72)
+# Seconds an already-met 72-hour condition is trusted without re-scanning
+_SEVENTY_TWO_HOUR_RESCAN = 3600.0
+
+# How long the overfill alarm stays active after the last detected overfill
+_OVERFILL_HOLD = timedelta(hours=2)
+
+# Every alarm that can trigger the 72-hour shutdown, across all profiles
+_SHUTDOWN_TRIGGERING_ALARMS = frozenset({
+    'low_pressure', 'high_pressure', 'under_pressure',
+    'over_pressure', 'pressure_sensor', 'zero_pressure',
+    'variable_pressure', 'digital_storage', 'vac_pump'
+})
+
+# Shutdown-triggering alarms for each profile
+_NO_ALARMS = frozenset()
+_PROFILE_SHUTDOWN_ALARMS = {
+    'CS8': _SHUTDOWN_TRIGGERING_ALARMS,
+    'CS9': frozenset({'vac_pump', 'pressure_sensor'}),
+    'CS12': frozenset({'pressure_sensor'}),
+}
+
+
+def _parse_start_time(value: Any) -> Optional[datetime]:
+    """
+    Convert a stored alarm start time to a datetime.
+    
+    Start times are stored as integer epoch seconds; older databases hold
+    ISO 8601 strings, which are still accepted.
+    
+    Args:
+        value: The stored value (epoch seconds, ISO string, or None)
+        
+    Returns:
+        The start time, or None if not set
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromtimestamp(int(value))
+    except ValueError:
+        return datetime.fromisoformat(value)
+
 
 class AlarmCondition(ABC):
     """
@@ -26,6 +75,8 @@ class AlarmCondition(ABC):
     different alarm types to implement their own specific condition logic.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def check(self, context: 'Alarm') -> bool:
         """
@@ -49,19 +100,25 @@ class AlarmCondition(ABC):
         Returns:
             The current pressure as a float, or -99.9 if unavailable
         """
+        # Fast path: value already parsed by the producer (ControlPanel.update_pressure_ui)
+        pressure = getattr(context.app, '_current_pressure_float', None)
+        if pressure is not None:
+            return pressure
+        
         pressure_value = context.app.current_pressure
         pressure = -99.9  # Default value for pressure
         
         if pressure_value:
             try:
-                # Extract numeric value from pressure string (e.g., '1.5 inHg')
-                if isinstance(pressure_value, str) and ' ' in pressure_value:
-                    pressure = pressure_value.split()[0]
+                if isinstance(pressure_value, (int, float)):
+                    pressure = float(pressure_value)
                 else:
-                    pressure = pressure_value
-                pressure = float(pressure)
+                    # Extract numeric value from pressure string (e.g., '1.5 inHg')
+                    idx = pressure_value.find(' ')
+                    pressure = float(pressure_value if idx < 0 else pressure_value[:idx])
             except ValueError:
-                Logger.debug('AlarmCondition: Could not parse pressure value')
+                if Logger.isEnabledFor(logging.DEBUG):
+                    Logger.debug('AlarmCondition: Could not parse pressure value')
         return pressure
 
 
@@ -73,6 +130,23 @@ class AlarmRepository:
     providing a clean interface for persistence operations.
     """
     
+    # Seconds a cached threshold / variable pressure point stays valid
+    _THRESHOLD_TTL = 2.0
+    # Shared by all repository instances so invalidation reaches every alarm:
+    # setting name -> (value, expiry on the monotonic clock)
+    _threshold_cache: Dict[str, tuple] = {}
+    _variable_pressure_cache: Dict[str, tuple] = {}
+    # Parsed datetimes, so each stored ISO string is parsed at most once:
+    # alarm name -> start time, and 'last_overfill_time' -> last overfill time
+    _start_time_cache: Dict[str, Optional[datetime]] = {}
+    _overfill_time_cache: Dict[str, Optional[datetime]] = {}
+    # User profile; changes only through ProfileHandler.save_profile()
+    _profile: Optional[str] = None
+    # Alarm sweep counter, advanced by AlarmManager.check_alarms(), and the
+    # GM fault result for that sweep as (tick id, exceeded)
+    _tick_id = 0
+    _gm_fault_tick_cache: Optional[tuple] = None
+    
     def __init__(self):
         """Initialize the alarm repository."""
         self.app = MDApp.get_running_app()
@@ -87,11 +161,19 @@ class AlarmRepository:
         Returns:
             The start time as a datetime object, or None if not found
         """
+        if alarm_name in self._start_time_cache:
+            return self._start_time_cache[alarm_name]
         try:
-            start_time = self.app.alarms_db.get_setting(f'{alarm_name}_start_time')
-            return datetime.fromisoformat(start_time) if start_time else None
+            key = f'{alarm_name}_start_time'
+            stored = self.app.alarms_db.get_setting(key)
+            start_time = _parse_start_time(stored)
+            if start_time is not None and not str(stored).isdigit():
+                # One-time migration of a legacy ISO string to epoch seconds
+                self.app.alarms_db.add_setting(key, int(start_time.timestamp()))
+            self._start_time_cache[alarm_name] = start_time
+            return start_time
         except Exception as e:
-            Logger.error(f'AlarmManager: Error getting start time for {alarm_name}: {e}')
+            Logger.error('AlarmManager: Error getting start time for %s: %s', alarm_name, e)
             return None
     
     def save_start_time(self, alarm_name: str, start_time: datetime) -> None:
@@ -103,10 +185,13 @@ class AlarmRepository:
             start_time: The start time to save
         """
         try:
-            self.app.alarms_db.add_setting(f'{alarm_name}_start_time', start_time.isoformat())
-            self.app.gm_db.add_setting(f'{alarm_name}_alarm', True)
+            # alarms and gm tables share app.db: commit both writes together
+            with self.app.alarms_db.transaction():
+                self.app.alarms_db.add_setting(f'{alarm_name}_start_time', int(start_time.timestamp()))
+                self.app.gm_db.add_setting(f'{alarm_name}_alarm', True)
+            self._start_time_cache[alarm_name] = start_time
         except Exception as e:
-            Logger.error(f'AlarmManager: Error saving start time for {alarm_name}: {e}')
+            Logger.error('AlarmManager: Error saving start time for %s: %s', alarm_name, e)
     
     def clear_start_time(self, alarm_name: str) -> None:
         """
@@ -116,10 +201,28 @@ class AlarmRepository:
             alarm_name: The name of the alarm
         """
         try:
-            self.app.alarms_db.add_setting(f'{alarm_name}_start_time', None)
-            self.app.gm_db.add_setting(f'{alarm_name}_alarm', False)
+            with self.app.alarms_db.transaction():
+                self.app.alarms_db.add_setting(f'{alarm_name}_start_time', None)
+                self.app.gm_db.add_setting(f'{alarm_name}_alarm', False)
+            self._start_time_cache[alarm_name] = None
+        except Exception as e:
+            Logger.error('AlarmManager: Error clearing start time for %s: %s', alarm_name, e)
+    
+    def clear_start_times(self, alarm_names: List[str]) -> None:
+        """
+        Clear the start times of several alarms in one database transaction.
+        
+        Args:
+            alarm_names: The names of the alarms to clear
+        """
+        try:
+            with self.app.alarms_db.transaction():
+                self.app.alarms_db.add_settings_many([(f'{name}_start_time', None) for name in alarm_names])
+                self.app.gm_db.add_settings_many([(f'{name}_alarm', False) for name in alarm_names])
+            for alarm_name in alarm_names:
+                self._start_time_cache[alarm_name] = None
         except Exception as e:
-            Logger.error(f'AlarmManager: Error clearing start time for {alarm_name}: {e}')
+            Logger.error('AlarmManager: Error clearing start times for %s: %s', alarm_names, e)
     
     def get_threshold(self, setting_name: str, default_value: Any) -> Any:
         """
@@ -132,6 +235,10 @@ class AlarmRepository:
         Returns:
             The threshold value
         """
+        now = time.monotonic()
+        cached = self._threshold_cache.get(setting_name)
+        if cached is not None and cached[1] > now:
+            return cached[0]
         try:
             threshold = self.app.thresholds_db.get_setting(setting_name)
             if threshold is None:
@@ -140,12 +247,61 @@ class AlarmRepository:
                 except Exception:
                     # If we can't save the default, just return it anyway
                     pass
-                return default_value
+                threshold = default_value
+            self._threshold_cache[setting_name] = (threshold, now + self._THRESHOLD_TTL)
             return threshold
         except Exception as e:
-            Logger.error(f'AlarmManager: Error getting threshold {setting_name}: {e}')
+            Logger.error('AlarmManager: Error getting threshold %s: %s', setting_name, e)
             return default_value
     
+    def get_profile(self) -> Optional[str]:
+        """
+        Get the current user profile, reading the database only on a cache miss.
+        
+        Returns:
+            The profile name, or None if it has not been set
+        """
+        profile = AlarmRepository._profile
+        if profile is None:
+            profile = self.app.user_db.get_setting('profile')
+            AlarmRepository._profile = profile
+        return profile
+    
+    @classmethod
+    def next_tick(cls) -> None:
+        """Start a new alarm sweep; per-tick cached results become stale."""
+        cls._tick_id += 1
+    
+    @classmethod
+    def invalidate_profile(cls) -> None:
+        """Drop the cached profile; call after the profile setting changes."""
+        cls._profile = None
+    
+    @classmethod
+    def invalidate_cached_state(cls) -> None:
+        """
+        Drop cached start times, overfill time and variable pressure point.
+        
+        Call this after writing alarm state to alarms_db directly (outside
+        this repository) so the next read comes from the database.
+        """
+        cls._start_time_cache.clear()
+        cls._overfill_time_cache.clear()
+        cls._variable_pressure_cache.clear()
+    
+    @classmethod
+    def invalidate_threshold(cls, setting_name: Optional[str] = None) -> None:
+        """
+        Drop a cached threshold so the next read goes to the database.
+        
+        Args:
+            setting_name: The threshold to drop, or None to drop all of them
+        """
+        if setting_name is None:
+            cls._threshold_cache.clear()
+        else:
+            cls._threshold_cache.pop(setting_name, None)
+    
     def get_last_overfill_time(self) -> Optional[datetime]:
         """
         Get the last time an overfill condition was detected.
@@ -153,11 +309,15 @@ class AlarmRepository:
         Returns:
             The last overfill time as a datetime, or None if not found
         """
+        if 'last_overfill_time' in self._overfill_time_cache:
+            return self._overfill_time_cache['last_overfill_time']
         try:
             overfill_time = self.app.alarms_db.get_setting('last_overfill_time', None)
-            return datetime.fromisoformat(overfill_time) if overfill_time else None
+            overfill_time = datetime.fromisoformat(overfill_time) if overfill_time else None
+            self._overfill_time_cache['last_overfill_time'] = overfill_time
+            return overfill_time
         except Exception as e:
-            Logger.error(f'AlarmManager: Error getting last overfill time: {e}')
+            Logger.error('AlarmManager: Error getting last overfill time: %s', e)
             return None
     
     def save_last_overfill_time(self, time: datetime) -> None:
@@ -169,19 +329,18 @@ class AlarmRepository:
         """
         try:
             self.app.alarms_db.add_setting('last_overfill_time', time.isoformat())
+            self._overfill_time_cache['last_overfill_time'] = time
         except Exception as e:
-            Logger.error(f'AlarmManager: Error saving last overfill time: {e}')
+            Logger.error('AlarmManager: Error saving last overfill time: %s', e)
     
     def clear_last_overfill_time(self) -> None:
         """Clear the last overfill time from the database."""
         try:
             self.app.alarms_db.add_setting('last_overfill_time', None)
+            self._overfill_time_cache['last_overfill_time'] = None
         except Exception as e:
-            Logger.error(f'AlarmManager: Error clearing last overfill time: {e}')
+            Logger.error('AlarmManager: Error clearing last overfill time: %s', e)
             
-    # In-memory storage for GM fault count
-    _gm_fault_count = 0
-    
     def get_gm_fault_count(self) -> int:
         """
         Get the current GM fault count.
@@ -189,21 +348,19 @@ class AlarmRepository:
         Returns:
             The current fault count from memory
         """
-        return self._gm_fault_count
+        return _gm_fault_count
     
     def increment_gm_fault_count(self) -> None:
         """Increment the GM fault count by 1."""
-        try:
-            self._gm_fault_count += 1
-        except Exception as e:
-            Logger.error(f'AlarmManager: Error incrementing GM fault count: {e}')
+        global _gm_fault_count
+        with _gm_fault_lock:
+            _gm_fault_count += 1
     
     def reset_gm_fault_count(self) -> None:
         """Reset the GM fault count to 0."""
-        try:
-            self._gm_fault_count = 0
-        except Exception as e:
-            Logger.error(f'AlarmManager: Error resetting GM fault count: {e}')
+        global _gm_fault_count
+        with _gm_fault_lock:
+            _gm_fault_count = 0
     
     def get_vac_pump_failure_count(self) -> int:
         """
@@ -222,7 +379,7 @@ class AlarmRepository:
             # This ensures the alarm is cleared when vac_pump_failure_count is None
             return 0
         except Exception as e:
-            Logger.error(f'AlarmManager: Error getting vac pump failure count: {e}')
+            Logger.error('AlarmManager: Error getting vac pump failure count: %s', e)
             return 0
     
     def increment_vac_pump_failure_count(self) -> None:
@@ -233,16 +390,17 @@ class AlarmRepository:
             self.app.alarms_db.add_setting('vac_pump_failure_count', count + 1)
             pass
         except Exception as e:
-            Logger.error(f'AlarmManager: Error incrementing vac pump failure count: {e}')
+            Logger.error('AlarmManager: Error incrementing vac pump failure count: %s', e)
     
     def reset_vac_pump_failure_count(self) -> None:
         """Reset the vacuum pump failure count to 0 and re-enable shutdown relay."""
         try:
-            # Reset the count in alarms_db
-            self.app.alarms_db.add_setting('vac_pump_failure_count', 0)
-            
-            # Clear vac pump alarm flag
-            self.app.gm_db.add_setting('vac_pump_alarm', False)
+            with self.app.alarms_db.transaction():
+                # Reset the count in alarms_db
+                self.app.alarms_db.add_setting('vac_pump_failure_count', 0)
+                
+                # Clear vac pump alarm flag
+                self.app.gm_db.add_setting('vac_pump_alarm', False)
             
             # Re-enable shutdown relay when vac pump alarm is cleared
             if hasattr(self.app, 'io') and hasattr(self.app.io, 'set_shutdown_relay'):
@@ -251,7 +409,7 @@ class AlarmRepository:
             
             pass
         except Exception as e:
-            Logger.error(f'AlarmManager: Error resetting vac pump failure count: {e}')
+            Logger.error('AlarmManager: Error resetting vac pump failure count: %s', e)
     
     def get_variable_pressure_point(self) -> Optional[float]:
         """
@@ -260,11 +418,17 @@ class AlarmRepository:
         Returns:
             The reference pressure point, or None if not set
         """
+        now = time.monotonic()
+        cached = self._variable_pressure_cache.get('variable_pressure_point')
+        if cached is not None and cached[1] > now:
+            return cached[0]
         try:
             value = self.app.alarms_db.get_setting('variable_pressure_point')
-            return float(value) if value is not None else None
+            value = float(value) if value is not None else None
+            self._variable_pressure_cache['variable_pressure_point'] = (value, now + self._THRESHOLD_TTL)
+            return value
         except Exception as e:
-            Logger.error(f'AlarmManager: Error getting variable pressure point: {e}')
+            Logger.error('AlarmManager: Error getting variable pressure point: %s', e)
             return None
     
     def set_variable_pressure_point(self, pressure: float) -> None:
@@ -276,8 +440,11 @@ class AlarmRepository:
         """
         try:
             self.app.alarms_db.add_setting('variable_pressure_point', pressure)
+            self._variable_pressure_cache['variable_pressure_point'] = (
+                float(pressure), time.monotonic() + self._THRESHOLD_TTL
+            )
         except Exception as e:
-            Logger.error(f'AlarmManager: Error setting variable pressure point: {e}')
+            Logger.error('AlarmManager: Error setting variable pressure point: %s', e)
     
     def log_notification(self, message: str) -> None:
         """
@@ -290,6 +457,23 @@ class AlarmRepository:
         pass
 
 
+# Shared AlarmRepository, created on first use by get_repository()
+_REPO_SINGLETON: Optional[AlarmRepository] = None
+
+
+def get_repository() -> AlarmRepository:
+    """
+    Get the AlarmRepository shared by the alarm manager and every alarm.
+    
+    Returns:
+        The shared repository instance
+    """
+    global _REPO_SINGLETON
+    if _REPO_SINGLETON is None:
+        _REPO_SINGLETON = AlarmRepository()
+    return _REPO_SINGLETON
+
+
 class Alarm:
     """
     Base class for system alarms with state tracking and persistence.
@@ -301,6 +485,13 @@ class Alarm:
     - Notification generation
     """
     
+    __slots__ = (
+        'app', 'name', 'duration', 'condition', 'repository',
+        'start_time', 'time_triggered', 'previous_pressure',
+        '_set_shutdown_relay', '_tick_now', '_has_pressure_sensor_alarm',
+        '_start_anchor', '_alarm_flag_cached',
+    )
+    
     def __init__(
         self, 
         name: str, 
@@ -315,18 +506,41 @@ class Alarm:
             name: Unique name for the alarm
             condition: The condition object that determines when this alarm triggers
             duration: The duration (in seconds) the condition must exist before alarm triggers
-            repository: The repository for alarm persistence (optional, will create a new one if not provided)
+            repository: The repository for alarm persistence (optional, defaults to the shared one)
         """
         self.app = MDApp.get_running_app()
         self.name = name.lower().replace(' ', '_')
         self.duration = duration
         self.condition = condition
         
-        # Create repository if not provided
-        self.repository = repository if repository is not None else AlarmRepository()
+        # Use the shared repository if none was provided
+        self.repository = repository if repository is not None else get_repository()
             
         # Initialize remaining properties
+        self.reload_state()
+        self.previous_pressure = None
+        
+        # Bound app callbacks, resolved on first use (app.io may not exist yet
+        # when alarms are first created during startup)
+        self._set_shutdown_relay = None
+        # Timestamp of the sweep in progress, shared with the condition check
+        self._tick_now: Optional[datetime] = None
+        self._has_pressure_sensor_alarm = hasattr(self.app, 'pressure_sensor_alarm')
+        # In-memory mirror of the {name}_alarm flag in gm_db. Unknown until the
+        # first clear, so assume it may be set.
+        self._alarm_flag_cached = True
+    
+    def reload_state(self) -> None:
+        """
+        Load start_time and the triggered state from the database.
+        
+        Called on creation, and after alarm state was written to the database
+        outside this class (e.g. an alarm cleared from a screen).
+        """
         self.start_time = self.repository.get_start_time(self.name)
+        # (start_time, time.monotonic() at that start time), so elapsed time is
+        # a float subtraction while start_time is unchanged
+        self._start_anchor: Optional[tuple] = None
         
         # If alarm has a start time from database, it was previously triggered
         # Restore the triggered state to maintain alarm persistence across reboots
@@ -337,14 +551,20 @@ class Alarm:
             
             if elapsed_time >= self.duration:
                 self.time_triggered = self.start_time + timedelta(seconds=self.duration)
-                Logger.info(f'AlarmManager: Restored active alarm state for {self.name} (started {self.start_time})')
+                Logger.info('AlarmManager: Restored active alarm state for %s (started %s)', self.name, self.start_time)
             else:
                 self.time_triggered = None
-                Logger.debug(f'AlarmManager: Restored pending alarm state for {self.name} (started {self.start_time}, needs {self.duration - elapsed_time:.1f}s more)')
+                Logger.debug('AlarmManager: Restored pending alarm state for %s (started %s, needs %.1fs more)', self.name, self.start_time, self.duration - elapsed_time)
         else:
             self.time_triggered = None
-            
-        self.previous_pressure = None
+    
+    def _shutdown_relay_setter(self) -> Optional[Callable]:
+        """Return app.io.set_shutdown_relay, caching it once it is available."""
+        setter = self._set_shutdown_relay
+        if setter is None:
+            setter = getattr(getattr(self.app, 'io', None), 'set_shutdown_relay', None)
+            self._set_shutdown_relay = setter
+        return setter
     
     
     def get_elapsed_time(self, current_time: datetime) -> float:
@@ -357,9 +577,17 @@ class Alarm:
         Returns:
             The elapsed time in seconds
         """
-        if not self.start_time:
+        start_time = self.start_time
+        if not start_time:
             return 0
-        return (current_time - self.start_time).total_seconds()
+        anchor = self._start_anchor
+        if anchor is not None and anchor[0] is start_time:
+            return time.monotonic() - anchor[1]
+        # No anchor for this start time (restored from the database, or
+        # start_time was reassigned): compute once from the wall clock
+        elapsed = (current_time - start_time).total_seconds()
+        self._start_anchor = (start_time, time.monotonic() - elapsed)
+        return elapsed
     
     def update_start_time(self, time_difference: timedelta) -> None:
         """
@@ -372,12 +600,20 @@ class Alarm:
             self.start_time += time_difference
             self.repository.save_start_time(self.name, self.start_time)
     
-    def update(self) -> bool:
+    def update(self, current_time: Optional[datetime] = None) -> bool:
         '''
         Update the alarm state based on the current condition
+        
+        Args:
+            current_time: Timestamp of the current alarm sweep; defaults to now
         '''
-        current_time = datetime.now()
-        self.start_time = self.repository.get_start_time(self.name)
+        if current_time is None:
+            current_time = datetime.now()
+        self._tick_now = current_time
+        # self.start_time is authoritative: it is loaded from the database in
+        # __init__ and every write path updates it alongside the database.
+        # Out-of-band database edits are picked up when alarms are reloaded
+        # (profile change / SIGUSR1 reload), which rebuilds the Alarm objects.
         
         # Check if the alarm condition is met
         condition_met = self.condition.check(self)
@@ -386,7 +622,9 @@ class Alarm:
             # If condition is met but start time not set, record the start time
             if self.start_time is None:
                 self.start_time = current_time
+                self._start_anchor = (current_time, time.monotonic())
                 self.repository.save_start_time(self.name, self.start_time)
+                self._alarm_flag_cached = True
  
             # Check if the condition has existed long enough to trigger the alarm
             elapsed_time = self.get_elapsed_time(current_time)
@@ -405,8 +643,9 @@ class Alarm:
                             self.app.toggle_pressure_sensor_alarm(True)
 
                         # Turn OFF shutdown relay for pressure sensor alarm (CS9 profile only)
-                        if hasattr(self.app, 'io') and hasattr(self.app.io, 'set_shutdown_relay'):
-                            self.app.io.set_shutdown_relay(False, 'pressure_sensor')
+                        set_shutdown_relay = self._shutdown_relay_setter()
+                        if set_shutdown_relay:
+                            set_shutdown_relay(False, 'pressure_sensor')
 
                 return True
 
@@ -421,36 +660,35 @@ class Alarm:
                 # Execute clearing actions based on alarm type
                 if self.name == 'pressure_sensor':
                     # Clearing actions for pressure sensor - only when actually triggered
-                    if hasattr(self.app, 'io') and hasattr(self.app.io, 'set_shutdown_relay'):
-                        self.app.io.set_shutdown_relay(True, 'pressure_sensor')
-                        Logger.info(f'AlarmManager: {self.name} alarm cleared, shutdown relay re-enabled')
+                    set_shutdown_relay = self._shutdown_relay_setter()
+                    if set_shutdown_relay:
+                        set_shutdown_relay(True, 'pressure_sensor')
+                        Logger.info('AlarmManager: %s alarm cleared, shutdown relay re-enabled', self.name)
                     
                     # Clear the pressure sensor alarm flag in the app
-                    if hasattr(self.app, 'pressure_sensor_alarm'):
+                    if self._has_pressure_sensor_alarm:
                         if self.app.pressure_sensor_alarm:
                             self.app.toggle_pressure_sensor_alarm(False)
 
                 elif self.name == 'vac_pump':
                     # Re-enable shutdown relay when vac pump alarm is cleared
-                    if hasattr(self.app, 'io') and hasattr(self.app.io, 'set_shutdown_relay'):
-                        self.app.io.set_shutdown_relay(True, 'vac_pump')
-                        Logger.info(f'AlarmManager: {self.name} alarm cleared, shutdown relay re-enabled')
+                    set_shutdown_relay = self._shutdown_relay_setter()
+                    if set_shutdown_relay:
+                        set_shutdown_relay(True, 'vac_pump')
+                        Logger.info('AlarmManager: %s alarm cleared, shutdown relay re-enabled', self.name)
                 
                 # Mark shutdown-triggering alarms as cleared for 72-hour tracking
-                # Note: This list includes all possible shutdown-triggering alarms across all profiles
-                shutdown_triggering_alarms = [
-                    'low_pressure', 'high_pressure', 'under_pressure',
-                    'over_pressure', 'pressure_sensor', 'zero_pressure',
-                    'variable_pressure', 'digital_storage', 'vac_pump'
-                ]
-                
-                if self.name in shutdown_triggering_alarms:
+                if self.name in _SHUTDOWN_TRIGGERING_ALARMS:
                     if hasattr(self.app, 'alarm_manager'):
                         self.app.alarm_manager.mark_shutdown_alarm_cleared(self.name)
             
-            # Always clear database state when condition is no longer met
-            self.repository.clear_start_time(self.name)
+            # Clear database state when condition is no longer met, unless
+            # it is already clear (the common case for an idle alarm)
+            if self.start_time is not None or self._alarm_flag_cached:
+                self.repository.clear_start_time(self.name)
+                self._alarm_flag_cached = False
             self.start_time = None
+            self._start_anchor = None
             self.time_triggered = None
         
         return False
@@ -462,6 +700,8 @@ class Alarm:
 class PressureSensorCondition(AlarmCondition):
     '''Condition for pressure sensor failure.'''
     
+    __slots__ = ()
+    
     def check(self, context: Alarm) -> bool:
         '''
         Returns True if pressure is below current low pressure threshold, False otherwise
@@ -476,9 +716,44 @@ class PressureSensorCondition(AlarmCondition):
         return float(pressure) < float(low_pressure_current_threshold)
 
 
+def _evaluate_gm_fault(context: Alarm) -> bool:
+    """
+    Check whether the GM fault count has reached its threshold (CS9 only).
+    
+    GMFaultCondition and VacPumpCondition both need this on CS9, so the
+    result is computed, and the cycle stopped, at most once per alarm sweep.
+    
+    Args:
+        context: The Alarm being checked
+        
+    Returns:
+        True if GM fault count has reached the threshold, False otherwise
+    """
+    repository = context.repository
+    cached = AlarmRepository._gm_fault_tick_cache
+    if cached is not None and cached[0] == AlarmRepository._tick_id:
+        return cached[1]
+    
+    exceeded = False
+    if repository.get_profile() == 'CS9':
+        # Get threshold from database, use 3 as default if not set
+        threshold = int(repository.get_threshold('gm_fault_count', 3))
+        fault_count = repository.get_gm_fault_count()
+        
+        # If fault_count is 0, the alarm should be cleared
+        exceeded = fault_count != 0 and fault_count >= threshold
+    
+    AlarmRepository._gm_fault_tick_cache = (AlarmRepository._tick_id, exceeded)
+    if exceeded:
+        context.app.io.stop_cycle()
+    return exceeded
+
+
 class GMFaultCondition(AlarmCondition):
     """Condition for GM fault checking."""
     
+    __slots__ = ()
+    
     def check(self, context: Alarm) -> bool:
         """
         Check if GM fault count has exceeded threshold.
@@ -487,23 +762,7 @@ class GMFaultCondition(AlarmCondition):
             True if GM fault count exceeds threshold, False otherwise
         """
         try:
-            # Only check GM faults for CS9 profile
-            profile = context.app.user_db.get_setting('profile')
-            if profile != 'CS9':
-                return False
-                
-            # Get threshold from database, use 3 as default if not set
-            threshold = int(context.repository.get_threshold('gm_fault_count', 3))
-            fault_count = int(context.repository.get_gm_fault_count())
-            
-            # If fault_count is 0, the alarm should be cleared
-            if fault_count == 0:
-                return False
-                
-            if fault_count >= threshold:
-                context.app.io.stop_cycle()
-                pass
-                
+            if _evaluate_gm_fault(context):
                 # Trigger vac pump alarm by setting failure count
                 context.repository.increment_vac_pump_failure_count()
                 context.app.gm_db.add_setting('vac_pump_alarm', True)
@@ -513,13 +772,15 @@ class GMFaultCondition(AlarmCondition):
                 return True
             return False
         except Exception as e:
-            Logger.error(f'AlarmManager: Error in GM fault check: {e}')
+            Logger.error('AlarmManager: Error in GM fault check: %s', e)
             return False
 
 
 class VacPumpCondition(AlarmCondition):
     """Condition for vacuum pump failure."""
     
+    __slots__ = ()
+    
     def check(self, context: Alarm) -> bool:
         """
         Check if vacuum pump has failed too many times or if GM faults exceed threshold (CS9 only).
@@ -528,12 +789,9 @@ class VacPumpCondition(AlarmCondition):
             True if vac pump failure count exceeds threshold or GM faults exceed threshold (CS9), False otherwise
         """
         try:
-            # Get profile to check if we need to consider GM faults
-            profile = context.app.user_db.get_setting('profile')
-            
             # Check vac pump failures
             vac_threshold = int(context.repository.get_threshold('vac_pump_fault_count', 10))
-            failure_count = int(context.repository.get_vac_pump_failure_count())
+            failure_count = context.repository.get_vac_pump_failure_count()
             
             # Check if vac pump failures exceed threshold
             if failure_count >= vac_threshold:
@@ -541,27 +799,18 @@ class VacPumpCondition(AlarmCondition):
                 pass
                 return True
             
-            # Check GM faults if in CS9 profile
-            if profile == 'CS9':
-                # Check GM faults
-                gm_threshold = int(context.repository.get_threshold('gm_fault_count', 3))
-                gm_fault_count = int(context.repository.get_gm_fault_count())
-                
-                # Check if GM faults exceed threshold
-                if gm_fault_count >= gm_threshold:
-                    context.app.io.stop_cycle()
-                    pass
-                    return True
-            
-            return False
+            # Check GM faults (CS9 profile only)
+            return _evaluate_gm_fault(context)
         except Exception as e:
-            Logger.error(f'AlarmManager: Error in vac pump check: {e}')
+            Logger.error('AlarmManager: Error in vac pump check: %s', e)
             return False
 
 
 class VariablePressureCondition(AlarmCondition):
     """Condition for variable pressure alarm."""
     
+    __slots__ = ()
+    
     def check(self, context: Alarm) -> bool:
         """
         Check if pressure has not changed beyond threshold within time period.
@@ -589,6 +838,8 @@ class VariablePressureCondition(AlarmCondition):
 class ZeroPressureCondition(AlarmCondition):
     """Condition for zero pressure alarm."""
     
+    __slots__ = ()
+    
     def check(self, context: Alarm) -> bool:
         """
         Check if pressure is near zero.
@@ -606,6 +857,8 @@ class ZeroPressureCondition(AlarmCondition):
 class OverPressureCondition(AlarmCondition):
     """Condition for high pressure alarm."""
     
+    __slots__ = ()
+    
     def check(self, context: Alarm) -> bool:
         """
         Check if pressure exceeds high threshold.
@@ -618,26 +871,28 @@ class OverPressureCondition(AlarmCondition):
             try:
                 threshold = context.repository.get_threshold('over_pressure', 2.0)
             except Exception as e:
-                Logger.error(f'AlarmManager: Error getting over_pressure threshold: {e}')
+                Logger.error('AlarmManager: Error getting over_pressure threshold: %s', e)
                 return False
             
             # Get pressure with error handling
             try:
                 pressure = self._get_pressure(context)
             except Exception as e:
-                Logger.error(f'AlarmManager: Error getting pressure for over_pressure check: {e}')
+                Logger.error('AlarmManager: Error getting pressure for over_pressure check: %s', e)
                 return False
             
             # Compare pressure to threshold
             return float(pressure) >= float(threshold)
         except Exception as e:
-            Logger.error(f'AlarmManager: Error in over_pressure check: {e}')
+            Logger.error('AlarmManager: Error in over_pressure check: %s', e)
             return False
 
 
 class UnderPressureCondition(AlarmCondition):
     """Condition for low pressure alarm."""
     
+    __slots__ = ()
+    
     def check(self, context: Alarm) -> bool:
         """
         Check if pressure is below low threshold.
@@ -650,26 +905,28 @@ class UnderPressureCondition(AlarmCondition):
             try:
                 threshold = context.repository.get_threshold('under_pressure', -6.0)
             except Exception as e:
-                Logger.error(f'AlarmManager: Error getting under_pressure threshold: {e}')
+                Logger.error('AlarmManager: Error getting under_pressure threshold: %s', e)
                 return False
             
             # Get pressure with error handling
             try:
                 pressure = self._get_pressure(context)
             except Exception as e:
-                Logger.error(f'AlarmManager: Error getting pressure for under_pressure check: {e}')
+                Logger.error('AlarmManager: Error getting pressure for under_pressure check: %s', e)
                 return False
             
             # Compare pressure to threshold
             return float(pressure) <= float(threshold)
         except Exception as e:
-            Logger.error(f'AlarmManager: Error in under_pressure check: {e}')
+            Logger.error('AlarmManager: Error in under_pressure check: %s', e)
             return False
 
 
 class OverfillCondition(AlarmCondition):
     """Condition for overfill alarm."""
     
+    __slots__ = ()
+    
     def check(self, context: Alarm) -> bool:
         """
         Check if overfill condition exists.
@@ -677,8 +934,7 @@ class OverfillCondition(AlarmCondition):
         Returns:
             True if overfill is detected, False otherwise
         """
-        current_time = datetime.now()
-        last_overfill_time = context.repository.get_last_overfill_time()
+        current_time = context._tick_now or datetime.now()
         
         # ==================================================================
         # SERIAL-ONLY: Overfill detection from ESP32 serial data.
@@ -698,10 +954,12 @@ class OverfillCondition(AlarmCondition):
                 context.repository.save_last_overfill_time(current_time)
                 return True
         except Exception as e:
-            Logger.error(f'AlarmManager: Error reading serial overfill: {e}')
+            Logger.error('AlarmManager: Error reading serial overfill: %s', e)
         
         # Maintain alarm state if overfill was detected within last 2 hours
-        if last_overfill_time and (current_time - last_overfill_time) < timedelta(hours=2):
+        # (served from the repository's in-memory cache after the first read)
+        last_overfill_time = context.repository.get_last_overfill_time()
+        if last_overfill_time and (current_time - last_overfill_time) < _OVERFILL_HOLD:
             return True
         
         return False
@@ -710,6 +968,15 @@ class OverfillCondition(AlarmCondition):
 class DigitalStorageCondition(AlarmCondition):
     """Condition for digital storage (SD card) alarm."""
     
+    __slots__ = ('_mount_cache',)
+    
+    # Seconds a mount check result is reused before /proc is read again
+    MOUNT_CHECK_TTL = 5.0
+    
+    def __init__(self):
+        # (monotonic time of the last check, result), or None before the first
+        self._mount_cache: Optional[tuple] = None
+    
     def check(self, context: Alarm) -> bool:
         """
         Check if digital storage condition exists.
@@ -717,59 +984,62 @@ class DigitalStorageCondition(AlarmCondition):
         Returns:
             True if digital storage is not available, False otherwise
         """
+        now = time.monotonic()
+        cached = self._mount_cache
+        if cached is not None and now - cached[0] < self.MOUNT_CHECK_TTL:
+            return cached[1]
+        
         # Try the safe method first, fallback to original if needed
         try:
-            return self._check_mounts_safe()
+            unavailable = self._check_mounts_safe()
         except Exception:
             # Fallback to original method if safe method fails
-            return self._check_mounts_original()
+            unavailable = self._check_mounts_original()
+        self._mount_cache = (now, unavailable)
+        return unavailable
     
-    def _check_mounts_safe(self) -> bool:
-        """Safe mount checking without signal conflicts - USB crash fix."""
-        import subprocess
-        import time
+    def invalidate_mount_cache(self) -> None:
+        """Force the next check to re-read the mount table."""
+        self._mount_cache = None
+    
+    @staticmethod
+    def _media_mounted(mount_table: str, field: int) -> bool:
+        """
+        Check whether any mount point in a /proc mount table is under /media/.
         
-        try:
-            # Add small delay to avoid checking during active USB mounting/unmounting
-            time.sleep(0.05)
-            
-            # Use subprocess with longer timeout but NO signal handlers to avoid USB event conflicts
-            result = subprocess.run(
-                ['lsblk', '-o', 'MOUNTPOINT,TYPE'],
-                capture_output=True,
-                text=True,
-                timeout=8  # Increased timeout to handle USB mounting delays
-            )
+        Args:
+            mount_table: Path of the table to read (/proc/mounts or mountinfo)
+            field: Index of the whitespace-separated mount point field
             
-            if result.returncode == 0 and '/media' in result.stdout:
-                return False
-            else:
-                self._clear_mount_directory_safe()
-                return True
-                
-        except subprocess.TimeoutExpired:
-            # If lsblk times out, it might be due to USB activity - assume storage unavailable
-            Logger.warning('AlarmManager: lsblk command timed out during USB activity, assuming storage unavailable')
-            self._clear_mount_directory_safe()
-            return True
-        except subprocess.CalledProcessError as e:
-            # If lsblk fails, assume storage unavailable
-            Logger.warning(f'AlarmManager: lsblk command failed: {e}, assuming storage unavailable')
-            self._clear_mount_directory_safe()
-            return True
-        except Exception as e:
-            # Any other error, assume storage unavailable
-            Logger.warning(f'AlarmManager: Unexpected error in mount check: {e}, assuming storage unavailable')
-            self._clear_mount_directory_safe()
-            return True
+        Returns:
+            True if something is mounted under /media/, False otherwise
+        """
+        with open(mount_table, 'r') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) > field and fields[field].startswith('/media/'):
+                    return True
+        return False
+    
+    def _check_mounts_safe(self) -> bool:
+        """
+        Check for mounted storage by reading /proc/mounts directly.
+        
+        This is the table lsblk reports mount points from, so reading it
+        avoids spawning a process (and the USB event signal conflicts that
+        came with it). If /proc/mounts cannot be read the OSError propagates
+        and check() falls back to _check_mounts_original().
+        """
+        if self._media_mounted('/proc/mounts', 1):
+            return False
+        self._clear_mount_directory_safe()
+        return True
     
     def _check_mounts_original(self) -> bool:
-        """Original mount checking method as fallback."""
+        """Fallback mount check using this process's mountinfo table."""
         try:
-            # Original code with shorter timeout
-            import os
-            mounts = os.popen('lsblk -o MOUNTPOINT,TYPE').read()
-            if '/media' in mounts:
+            # Mount point is the 5th field of each mountinfo line
+            if self._media_mounted('/proc/self/mountinfo', 4):
                 return False
             else:
                 self._clear_mount_directory()
@@ -785,26 +1055,32 @@ class DigitalStorageCondition(AlarmCondition):
             self._clear_mount_directory()
         except OSError as e:
             # If cleanup fails due to USB activity or permissions, just log and continue
-            Logger.warning(f'AlarmManager: Mount directory cleanup failed (likely due to USB activity): {e}')
+            Logger.warning('AlarmManager: Mount directory cleanup failed (likely due to USB activity): %s', e)
         except Exception as e:
             # Any other error during cleanup - not critical, just log
-            Logger.warning(f'AlarmManager: Unexpected error during mount directory cleanup: {e}')
+            Logger.warning('AlarmManager: Unexpected error during mount directory cleanup: %s', e)
     
     def _clear_mount_directory(self) -> None:
         """Original clear mount directory method."""
         directory = '/media/cpx003'
+        # scandir gets each entry's type from the directory read itself, so
+        # no extra stat per entry. Other OSErrors (e.g. permissions) propagate
+        # to _clear_mount_directory_safe(), which logs them.
         try:
-            # Check if directory exists
-            if os.path.exists(directory):
-                for item in os.listdir(directory):
-                    item_path = os.path.join(directory, item)
-                    if os.path.isfile(item_path):
-                        os.remove(item_path)
-                    elif os.path.isdir(item_path):
-                        shutil.rmtree(item_path)
-        except OSError as e:
-            if e.errno != errno.ENOENT:
-                pass
+            entries = os.scandir(directory)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        # Files and symlinks (never followed)
+                        os.unlink(entry.path)
+                except FileNotFoundError:
+                    # Removed underneath us (e.g. USB unplugged)
+                    continue
 
 
 class SeventyTwoHourCondition(AlarmCondition):
@@ -815,6 +1091,13 @@ class SeventyTwoHourCondition(AlarmCondition):
     instead of doing expensive calculations every time.
     """
     
+    __slots__ = ('_alarm_manager',)
+    
+    def __init__(self):
+        # AlarmManager, resolved on the first check. Conditions are rebuilt
+        # whenever alarms are reloaded, so this never outlives the app setup.
+        self._alarm_manager = None
+    
     def check(self, context: Alarm) -> bool:
         """
         Check if conditions exist that would eventually lead to a 72-hour shutdown.
@@ -829,15 +1112,19 @@ class SeventyTwoHourCondition(AlarmCondition):
         try:
             # Use cached result from the separate 72-hour checker
             # This eliminates all the expensive nested loop logic
-            if hasattr(context.app, 'alarm_manager') and hasattr(context.app.alarm_manager, '_cached_72_hour_state'):
-                return context.app.alarm_manager._cached_72_hour_state
+            alarm_manager = self._alarm_manager
+            if alarm_manager is None:
+                alarm_manager = getattr(context.app, 'alarm_manager', None)
+                self._alarm_manager = alarm_manager
+            if alarm_manager is not None:
+                return alarm_manager._cached_72_hour_state
             
             # Fallback to False if cache not available (shouldn't happen in normal operation)
             Logger.warning('AlarmManager: 72-hour cache not available, returning False')
             return False
             
         except Exception as e:
-            Logger.error(f'AlarmManager: Error in SeventyTwoHourCondition check: {e}')
+            Logger.error('AlarmManager: Error in SeventyTwoHourCondition check: %s', e)
             return False
 
 
@@ -852,14 +1139,30 @@ class AlarmManager:
     - Coordinating alarm responses
     """
     
+    # Longest time a sweep may be skipped while the app's input_version is
+    # unchanged; picks up inputs that do not bump it
+    _FULL_SWEEP_INTERVAL = 5.0
+    
+    # Alarms whose conditions stop the cycle (or read inputs outside
+    # input_version: DB fault counters, storage mounts). These are evaluated
+    # on every tick, even when the rest of the sweep is skipped.
+    _INTERLOCK_CONDITIONS = (
+        OverfillCondition, VacPumpCondition, GMFaultCondition, DigitalStorageCondition,
+    )
+    
     def __init__(self):
         """Initialize the alarm manager."""
         self.app = None  # Will be set when get_running_app() is available
-        self.repository = AlarmRepository()
+        self.repository = get_repository()
         self.alarms = []
+        # Same alarms as self.alarms, keyed by name
+        self._alarms_by_name: Dict[str, Alarm] = {}
         self.active_alarms: Set[str] = set()
-        self._stop_event = threading.Event()
-        self._alarm_thread = None
+        # Alarms that became active since the UI last called take_added_alarms()
+        self.added_alarms: Set[str] = frozenset()
+        # app.input_version and time.monotonic() of the last full sweep
+        self._last_sweep_version = None
+        self._last_sweep_time = 0.0
         
         # Separate 72-hour checker attributes
         self._72_hour_check_event = None
@@ -885,15 +1188,16 @@ class AlarmManager:
         
         # Clear existing alarms
         self.alarms = []
+        self._alarms_by_name = {}
         
         # Let ProfileHandler create the appropriate alarms for current profile
         if hasattr(self.app, 'profile_handler'):
             try:
                 self.app.profile_handler.load_alarms()
-                Logger.info(f'AlarmManager: Profile-specific alarms initialized via ProfileHandler')
+                Logger.info('AlarmManager: Profile-specific alarms initialized via ProfileHandler')
                 return
             except Exception as e:
-                Logger.error(f'AlarmManager: Error loading profile alarms: {e}')
+                Logger.error('AlarmManager: Error loading profile alarms: %s', e)
         
         # Fallback: Create basic alarms if ProfileHandler is not available
         Logger.warning('AlarmManager: ProfileHandler not available, creating basic alarm set')
@@ -924,39 +1228,25 @@ class AlarmManager:
             )
         ]
         self.alarms = basic_alarms
+        self._alarms_by_name = {alarm.name: alarm for alarm in basic_alarms}
         
     def start_alarm_thread(self) -> None:
-        """Start a thread for checking alarms."""
-        # Don't start a new thread if one is already running
-        if self._alarm_thread and self._alarm_thread.is_alive():
-            return
-            
-        self._stop_event.clear()
-        self._alarm_thread = threading.Thread(
-            target=self._run_alarm_checks,
-            daemon=True,
-            name="AlarmCheckerThread"
-        )
-        self._alarm_thread.start()
-        Logger.info(f'AlarmManager: Alarm checker thread started')
+        """
+        Start the periodic checks owned by the alarm manager.
         
-        # Start separate 72-hour checker
+        The alarm sweep itself is driven by ControlPanel.check_alarms on the
+        app's Clock, so only the 72-hour checker is scheduled here; a second
+        sweep schedule would run every check twice on the UI thread.
+        """
         self.start_72_hour_checker()
     
     def stop_alarm_thread(self) -> None:
-        """Stop the alarm checking thread."""
-        self._stop_event.set()
-        if self._alarm_thread and self._alarm_thread.is_alive():
-            self._alarm_thread.join(timeout=2.0)
-            Logger.info(f'AlarmManager: Alarm checker thread stopped')
-        
-        # Stop separate 72-hour checker
+        """Stop the periodic checks owned by the alarm manager."""
         self.stop_72_hour_checker()
     
     def start_72_hour_checker(self) -> None:
         """Start separate 72-hour checking process using Kivy Clock."""
         try:
-            from kivy.clock import Clock
             if self._72_hour_check_event is None:
                 self._72_hour_check_event = Clock.schedule_interval(
                     self.check_72_hour_conditions,
@@ -964,7 +1254,7 @@ class AlarmManager:
                 )
                 Logger.info('AlarmManager: 72-hour checker started (5-minute intervals)')
         except Exception as e:
-            Logger.error(f'AlarmManager: Error starting 72-hour checker: {e}')
+            Logger.error('AlarmManager: Error starting 72-hour checker: %s', e)
     
     def stop_72_hour_checker(self) -> None:
         """Stop the separate 72-hour checker."""
@@ -974,12 +1264,12 @@ class AlarmManager:
                 self._72_hour_check_event = None
                 Logger.info('AlarmManager: 72-hour checker stopped')
         except Exception as e:
-            Logger.error(f'AlarmManager: Error stopping 72-hour checker: {e}')
+            Logger.error('AlarmManager: Error stopping 72-hour checker: %s', e)
     
     def mark_shutdown_alarm_cleared(self, alarm_name: str) -> None:
         """Mark that a shutdown-triggering alarm was cleared."""
         self._shutdown_alarm_changes.add(alarm_name)
-        Logger.debug(f'AlarmManager: Marked {alarm_name} for 72-hour check')
+        Logger.debug('AlarmManager: Marked %s for 72-hour check', alarm_name)
     
     def check_72_hour_conditions(self, dt=None) -> None:
         """
@@ -987,9 +1277,15 @@ class AlarmManager:
         This contains the expensive logic moved from Alarm.update().
         """
         try:
-            import time
+            # Once met, the condition can only lift when a shutdown-triggering
+            # alarm clears (recorded in _shutdown_alarm_changes) or the alarms
+            # are reset (which drops the cached state). Skip the scan until then,
+            # with a full re-scan at least hourly as a safety net.
+            if (self._cached_72_hour_state and not self._shutdown_alarm_changes and
+                    time.monotonic() - self._last_72_hour_check < _SEVENTY_TWO_HOUR_RESCAN):
+                return
+            
             current_time = datetime.now()
-            shutdown_duration = 72 * 60 * 60  # 72 hours in seconds
             
             # Ensure app reference is available
             if not self.app:
@@ -997,107 +1293,131 @@ class AlarmManager:
             
             # Get profile to determine which alarms to check
             try:
-                profile = self.app.user_db.get_setting('profile')
+                profile = self.repository.get_profile()
                 if profile is None:
                     profile = 'CS8'
             except Exception:
                 profile = 'CS8'
             
             # Define shutdown-triggering alarm names based on profile
-            if profile == 'CS8':
-                shutdown_triggering_alarms = [
-                    'low_pressure', 'high_pressure', 'under_pressure',
-                    'over_pressure', 'pressure_sensor', 'zero_pressure',
-                    'variable_pressure', 'digital_storage', 'vac_pump'
-                ]
-            elif profile == 'CS9':
-                shutdown_triggering_alarms = ['vac_pump', 'pressure_sensor']
-            elif profile == 'CS12':
-                shutdown_triggering_alarms = ['pressure_sensor']
-            else:
-                shutdown_triggering_alarms = []
+            shutdown_triggering_alarms = _PROFILE_SHUTDOWN_ALARMS.get(profile, _NO_ALARMS)
             
             # Check if any shutdown-triggering alarms have been active for 72+ hours
             shutdown_condition_met = False
             active_72_hour_alarms = []
             
-            for alarm in self.alarms:
-                if (alarm.name in shutdown_triggering_alarms and
-                    alarm.start_time and
-                    (current_time - alarm.start_time).total_seconds() >= shutdown_duration):
+            for name in shutdown_triggering_alarms:
+                alarm = self._alarms_by_name.get(name)
+                if (alarm is not None and
+                    alarm.start_time is not None and
+                    (current_time - alarm.start_time) >= _SEVENTY_TWO_HOURS):
                     shutdown_condition_met = True
                     active_72_hour_alarms.append(alarm.name)
             
             # Log if condition changed
             if shutdown_condition_met != self._cached_72_hour_state:
                 if shutdown_condition_met:
-                    Logger.info(f'AlarmManager: 72-hour shutdown condition met for alarms: {active_72_hour_alarms}')
+                    Logger.info('AlarmManager: 72-hour shutdown condition met for alarms: %s', active_72_hour_alarms)
                 else:
                     Logger.info('AlarmManager: 72-hour shutdown condition cleared')
             
             # Update 72-hour shutdown alarm state
-            self._update_72_hour_shutdown_state(shutdown_condition_met)
+            self._update_72_hour_shutdown_state(shutdown_condition_met, current_time)
             
             # Cache the result and update timestamp
             self._cached_72_hour_state = shutdown_condition_met
-            self._last_72_hour_check = time.time()
+            self._last_72_hour_check = time.monotonic()
             
             # Clear the change tracking
             self._shutdown_alarm_changes.clear()
             
         except Exception as e:
-            Logger.error(f'AlarmManager: Error in 72-hour check: {e}')
+            Logger.error('AlarmManager: Error in 72-hour check: %s', e)
     
-    def _update_72_hour_shutdown_state(self, condition_met: bool) -> None:
-        """Update the 72-hour shutdown alarm state."""
+    def _update_72_hour_shutdown_state(self, condition_met: bool, now: Optional[datetime] = None) -> None:
+        """
+        Update the 72-hour shutdown alarm state.
+        
+        Args:
+            condition_met: Whether the 72-hour shutdown condition is met
+            now: Timestamp of the current check; defaults to now
+        """
         try:
             # Find the 72-hour shutdown alarm
-            for alarm in self.alarms:
-                if alarm.name == '72_hour_shutdown':
-                    if condition_met:
-                        # Activate 72-hour shutdown
-                        if not alarm.start_time:
-                            alarm.start_time = datetime.now()
-                            alarm.repository.save_start_time(alarm.name, alarm.start_time)
-                            alarm.time_triggered = alarm.start_time
-                            if hasattr(self.app, 'toggle_shutdown'):
-                                self.app.toggle_shutdown(True)
-                            Logger.info('AlarmManager: 72-hour shutdown activated')
-                    else:
-                        # Clear 72-hour shutdown
-                        if alarm.start_time:
-                            alarm.repository.clear_start_time(alarm.name)
-                            alarm.start_time = None
-                            alarm.time_triggered = None
-                            if hasattr(self.app, 'toggle_shutdown'):
-                                self.app.toggle_shutdown(False)
-                            Logger.info('AlarmManager: 72-hour shutdown cleared')
-                    break
+            alarm = self._alarms_by_name.get('72_hour_shutdown')
+            if alarm is not None:
+                if condition_met:
+                    # Activate 72-hour shutdown
+                    if not alarm.start_time:
+                        alarm.start_time = now or datetime.now()
+                        alarm.repository.save_start_time(alarm.name, alarm.start_time)
+                        alarm.time_triggered = alarm.start_time
+                        if hasattr(self.app, 'toggle_shutdown'):
+                            self.app.toggle_shutdown(True)
+                        Logger.info('AlarmManager: 72-hour shutdown activated')
+                else:
+                    # Clear 72-hour shutdown
+                    if alarm.start_time:
+                        alarm.repository.clear_start_time(alarm.name)
+                        alarm.start_time = None
+                        alarm.time_triggered = None
+                        if hasattr(self.app, 'toggle_shutdown'):
+                            self.app.toggle_shutdown(False)
+                        Logger.info('AlarmManager: 72-hour shutdown cleared')
         except Exception as e:
-            Logger.error(f'AlarmManager: Error updating 72-hour shutdown state: {e}')
+            Logger.error('AlarmManager: Error updating 72-hour shutdown state: %s', e)
     
-    def _run_alarm_checks(self) -> None:
-        """Run periodic alarm checks."""
-        # Set up exception handling for the thread
-        try:
-            while not self._stop_event.is_set():
-                self.check_alarms()
-                # Sleep for 1 second between checks
-                time.sleep(1)
-        except Exception as e:
-            Logger.error(f'AlarmManager: Error in alarm checker thread: {e}')
-            # Try to restart the thread
-            time.sleep(5)
-            if not self._stop_event.is_set():
-                self._alarm_thread = threading.Thread(
-                    target=self._run_alarm_checks, 
-                    daemon=True,
-                    name="AlarmCheckerThread"
-                )
-                self._alarm_thread.start()
+    def _sweep_can_be_skipped(self) -> bool:
+        """
+        Check whether nothing an alarm depends on can have changed since the last sweep.
+        
+        Returns:
+            True if the app's input_version is unchanged, no alarm is waiting out
+            its trigger duration, and the last full sweep is recent enough
+        """
+        version = getattr(self.app, 'input_version', None)
+        if version is None or version != self._last_sweep_version:
+            return False
+        if time.monotonic() - self._last_sweep_time >= self._FULL_SWEEP_INTERVAL:
+            return False
+        # A pending alarm must be re-evaluated so it triggers on time
+        return not any(
+            alarm.start_time is not None and alarm.time_triggered is None
+            for alarm in self.alarms
+        )
     
-    def check_alarms(self) -> None:
-        """Check all alarms and update active alarm list."""
+    def _interlocks_changed(self) -> bool:
+        """
+        Evaluate the interlock alarms on a tick whose full sweep would be skipped.
+        
+        Returns:
+            True if any interlock alarm's active state differs from the last
+            sweep (the caller then runs a full sweep)
+        """
+        AlarmRepository.next_tick()
+        current_time = datetime.now()
+        for alarm in self.alarms:
+            if not isinstance(alarm.condition, self._INTERLOCK_CONDITIONS):
+                continue
+            try:
+                if alarm.update(current_time) != (alarm.name in self.active_alarms):
+                    return True
+                # A condition that just started must be timed by full sweeps
+                if alarm.start_time is not None and alarm.time_triggered is None:
+                    return True
+            except Exception as e:
+                Logger.error('AlarmManager: Error checking alarm %s: %s', alarm.name, e)
+                return True
+        return False
+    
+    def check_alarms(self, dt=None, force: bool = False) -> None:
+        """
+        Check all alarms and update active alarm list.
+        
+        Args:
+            dt: Kivy Clock delta time (unused)
+            force: Re-evaluate every alarm even if no input has changed
+        """
         # Ensure app reference is available
         if not self.app:
             self.app = MDApp.get_running_app()
@@ -1110,79 +1430,57 @@ class AlarmManager:
                 try:
                     self.app.profile_handler.load_alarms()
                 except Exception as e:
-                    Logger.error(f'AlarmManager: Error loading profile alarms in check_alarms: {e}')
+                    Logger.error('AlarmManager: Error loading profile alarms in check_alarms: %s', e)
                     # Fallback to basic initialization
                     self.initialize_alarms()
             else:
                 # No ProfileHandler available, use basic initialization
                 self.initialize_alarms()
             
+        if not force and self._sweep_can_be_skipped() and not self._interlocks_changed():
+            return
+        self._last_sweep_version = getattr(self.app, 'input_version', None)
+        self._last_sweep_time = time.monotonic()
+        
         # Check each alarm and update active alarm set
         currently_active = set()
+        AlarmRepository.next_tick()
+        current_time = datetime.now()
         try:
             for alarm in self.alarms:
                 try:
-                    if alarm.update():
+                    if alarm.update(current_time):
                         currently_active.add(alarm.name)
                 except Exception as e:
-                    Logger.error(f'AlarmManager: Error checking alarm {alarm.name}: {e}')
+                    Logger.error('AlarmManager: Error checking alarm %s: %s', alarm.name, e)
             
-            # Special check for 72_hour_shutdown alarm
-            # It should be cleared if no shutdown-triggering alarms have been active for 72 hours
-            if '72_hour_shutdown' in currently_active:
-                # Get the profile to determine which alarms to check
-                profile = self.app.user_db.get_setting('profile')
-                if profile is None:
-                    profile = 'CS8'
-                
-                # Define shutdown-triggering alarm names based on profile
-                if profile == 'CS8':
-                    shutdown_triggering_alarms = [
-                        'low_pressure', 'high_pressure', 'under_pressure',
-                        'over_pressure', 'pressure_sensor', 'zero_pressure',
-                        'variable_pressure', 'digital_storage', 'vac_pump'
-                    ]
-                elif profile == 'CS9':
-                    shutdown_triggering_alarms = ['vac_pump', 'pressure_sensor']
-                elif profile == 'CS12':
-                    shutdown_triggering_alarms = ['pressure_sensor']
-                else:
-                    shutdown_triggering_alarms = []
-                
-                # Check if any shutdown-triggering alarms are active for 72 hours
-                current_time = datetime.now()
-                shutdown_duration = 72 * 60 * 60  # 72 hours in seconds
-                shutdown_condition_met = False
-                
-                for alarm in self.alarms:
-                    if (alarm.name in shutdown_triggering_alarms and
-                        alarm.name in currently_active and
-                        alarm.start_time and
-                        (current_time - alarm.start_time).total_seconds() >= shutdown_duration):
-                        shutdown_condition_met = True
-                        break
-                
-                # If no shutdown-triggering alarms have been active for 72 hours, clear the 72_hour_shutdown alarm
-                if not shutdown_condition_met:
-                    Logger.info(f'AlarmManager: Clearing 72_hour_shutdown alarm as no triggering alarms have been active for 72 hours')
-                    currently_active.discard('72_hour_shutdown')
-                    
-                    # Find the 72_hour_shutdown alarm and clear its start time
-                    for alarm in self.alarms:
-                        if alarm.name == '72_hour_shutdown':
-                            alarm.repository.clear_start_time(alarm.name)
-                            alarm.start_time = None
-                            alarm.time_triggered = None
-                            break
-                    
-                    # Make sure shutdown state is cleared
-                    if hasattr(self.app, 'shutdown') and self.app.shutdown:
-                        self.app.toggle_shutdown(False)
+            # The 72-hour state is owned by check_72_hour_conditions() (every
+            # 5 minutes). Re-run it now only if a shutdown-triggering alarm
+            # cleared during this sweep, so a lifted condition ends the
+            # shutdown without waiting for the next interval.
+            if self._shutdown_alarm_changes:
+                self.check_72_hour_conditions()
+            if '72_hour_shutdown' in currently_active and not self._cached_72_hour_state:
+                currently_active.discard('72_hour_shutdown')
             
-            # Update active alarms set
+            # Update active alarms set. New alarms are kept in added_alarms
+            # until the UI takes them, dropping any that cleared meanwhile.
+            self.added_alarms = frozenset(
+                (self.added_alarms | (currently_active - self.active_alarms)) & currently_active
+            )
             self.active_alarms = currently_active
         except Exception as e:
-            Logger.error(f'AlarmManager: Error in check_alarms: {e}')
+            Logger.error('AlarmManager: Error in check_alarms: %s', e)
+    
+    def take_added_alarms(self) -> Set[str]:
+        """
+        Return the alarms added since the last call and reset the set.
+        
+        Returns:
+            Names of alarms that became active and are still active
+        """
+        added, self.added_alarms = self.added_alarms, frozenset()
+        return added
     
     def get_active_alarms(self) -> List[str]:
         """
@@ -1211,7 +1509,8 @@ class AlarmManager:
             alarm: The alarm instance to add
         """
         self.alarms.append(alarm)
-        Logger.debug(f'AlarmManager: Added alarm: {alarm.name}')
+        self._alarms_by_name[alarm.name] = alarm
+        Logger.debug('AlarmManager: Added alarm: %s', alarm.name)
     
     def get_alarm_names(self) -> List[str]:
         """
@@ -1232,7 +1531,7 @@ class AlarmManager:
         Returns:
             True if the alarm exists, False otherwise
         """
-        return any(alarm.name == alarm_name for alarm in self.alarms)
+        return alarm_name in self._alarms_by_name
     
     def clear_alarms(self) -> None:
         """Reset all alarms and clear any active states."""
@@ -1240,11 +1539,7 @@ class AlarmManager:
         self.active_alarms.clear()
         
         # Clear any alarm start times from database for existing alarms
-        for alarm in self.alarms:
-            try:
-                alarm.repository.clear_start_time(alarm.name)
-            except Exception as e:
-                Logger.error(f'AlarmManager: Error clearing start time for {alarm.name}: {e}')
+        self.repository.clear_start_times([alarm.name for alarm in self.alarms])
         
         # If the app has a shutdown state, reset it
         if hasattr(self, 'app') and self.app and hasattr(self.app, 'shutdown') and self.app.shutdown:
@@ -1252,6 +1547,9 @@ class AlarmManager:
             
         # Reset alarm instances
         self.alarms = []
+        self._alarms_by_name = {}
+        self._last_sweep_version = None
+        AlarmRepository.invalidate_cached_state()
         
         # Clear cached 72-hour state
         self._cached_72_hour_state = False
@@ -1260,6 +1558,30 @@ class AlarmManager:
         
         Logger.info('AlarmManager: All alarms cleared and states reset')
     
+    def reload_alarm_states(self, alarm_names: Optional[List[str]] = None) -> None:
+        """
+        Re-read alarm state that was written to the database directly.
+        
+        Screens that clear alarms through alarms_db/gm_db call this right
+        after writing, so the next sweep sees the change without waiting for
+        the debounced reload signal.
+        
+        Args:
+            alarm_names: Alarms to reload; all alarms if None
+        """
+        AlarmRepository.invalidate_cached_state()
+        if alarm_names is None:
+            alarms = self.alarms
+        else:
+            alarms = [self._alarms_by_name[name] for name in alarm_names if name in self._alarms_by_name]
+        for alarm in alarms:
+            try:
+                alarm.reload_state()
+            except Exception as e:
+                Logger.error('AlarmManager: Error reloading state for %s: %s', alarm.name, e)
+        # Make the next check_alarms() a full sweep
+        self._last_sweep_version = None
+    
     def reset_alarm_instances_only(self) -> None:
         """
         Reset only alarm instances without clearing persistent database states.
@@ -1273,6 +1595,11 @@ class AlarmManager:
         
         # Reset alarm instances only - DO NOT clear database states
         self.alarms = []
+        self._alarms_by_name = {}
+        self._last_sweep_version = None
+        # New instances must re-read their state from the database
+        AlarmRepository.invalidate_cached_state()
+        AlarmRepository.invalidate_profile()
         
         # Clear cached 72-hour state (will be recalculated)
         self._cached_72_hour_state = False
@@ -6,7 +6,6 @@ allowing the application to recognize when alarms are cleared or modified by ext
 
 import signal
 import logging
-import threading
 import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
@@ -20,9 +19,9 @@ from .database_manager import DatabaseManager
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Debounce lock and timestamp
-_reload_lock = threading.Lock()
-_last_reload_time = 0
+# Debounce timestamp (time.monotonic()). No lock: the handler runs in signal
+# context on the main thread, which may already hold any lock we take.
+_last_reload_time = float('-inf')
 _min_reload_interval = 1.0  # seconds
 
 def setup_signal_handlers(app):
@@ -51,18 +50,16 @@ def debounced_reload_alarms(app):
     """
     global _last_reload_time
     
-    # Get current time for debounce check
-    current_time = time.time()
+    # Get current time for debounce check (immune to wall-clock changes)
+    current_time = time.monotonic()
     
-    # Use lock for thread safety
-    with _reload_lock:
-        # If reload was called too recently, ignore this call
-        if current_time - _last_reload_time < _min_reload_interval:
-            logger.info("Ignoring reload signal (within debounce period)")
-            return
-            
-        # Update reload timestamp
-        _last_reload_time = current_time
+    # If reload was called too recently, ignore this call
+    if current_time - _last_reload_time < _min_reload_interval:
+        logger.info("Ignoring reload signal (within debounce period)")
+        return
+        
+    # Update reload timestamp (a single global store, atomic under the GIL)
+    _last_reload_time = current_time
     
     # Queue the reload operation to avoid database contention
     logger.info("Queueing alarm reload operation")
@@ -119,11 +116,11 @@ def _main_thread_ui_updates(app):
     """
     try:
         # Reset UI-related alarm state
-        app.alarm_list_last_check.clear()
         app.alarm_list.clear()
         
-        # Force an immediate alarm check
-        app.check_alarms()
+        # Force an immediate alarm check; the reload cleared the active set,
+        # so every alarm still active is reported as newly added
+        app.check_alarms(force=True)
         
         # Check if shutdown should be exited
         if hasattr(app, 'shutdown') and app.shutdown and not app.alarm:
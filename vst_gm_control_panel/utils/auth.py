@@ -3,14 +3,34 @@ Authentication utilities for SORACOM API.
 '''
 
 # Standard imports.
+import hashlib
 import json
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
 
 ## Kivy imports.
 from kivy.logger import Logger
 
 # Local imports.
 
+# Shared SORACOM API session: pooled keep-alive connections, so repeated
+# calls reuse one TLS connection instead of handshaking each time.
+# Other modules making SORACOM REST calls should import and use this.
+session = requests.Session()
+session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+session.headers.update({'Content-type': 'application/json'})
+
+# (api_key, token) per credentials hash, reused until _TOKEN_TTL seconds old
+# (below SORACOM's one-hour token lifetime)
+_TOKEN_TTL = 3000
+_TOKEN_CACHE = {}
+_token_lock = threading.Lock()
+
+# (email, password) from sys/auth.db, loaded on first use; see reload_credentials()
+_credentials = None
+
 class AuthError(Exception):
     '''Base class for authentication errors'''
     pass
@@ -23,7 +43,19 @@ class ApiError(AuthError):
     '''Error when API request fails'''
     pass
 
+def reload_credentials():
+    '''
+    Forget the cached SORACOM credentials so the next call re-reads sys/auth.db.
+    
+    Call this after the stored credentials are changed.
+    '''
+    global _credentials
+    _credentials = None
+
 def get_credentials():
+    global _credentials
+    if _credentials is not None:
+        return _credentials
     from .database_manager import DatabaseManager
     try:
         # Get credentials from database
@@ -32,7 +64,9 @@ def get_credentials():
         password = db.get_setting('soracom_password')
         if not email or not password:
             raise CredentialsError('Email or password not found in database')
-        return email, password
+        # Only complete credentials are cached; failures are retried next call
+        _credentials = (email, password)
+        return _credentials
     except CredentialsError as e:
         Logger.error(f'Modem: {str(e)}')
         raise
@@ -40,19 +74,34 @@ def get_credentials():
         Logger.error(f'Modem: Error getting credentials: {e}')
         raise CredentialsError(f'Failed to retrieve credentials: {str(e)}')
 
+def _credentials_key(email, password):
+    '''Hash the credentials so plaintext is never kept as a cache key.'''
+    return hashlib.sha256(f'{email}\0{password}'.encode()).hexdigest()
+
+def invalidate_auth():
+    '''
+    Drop cached SORACOM tokens, e.g. after a 401 from the API.
+    '''
+    with _token_lock:
+        _TOKEN_CACHE.clear()
+
 def get_auth():
     '''
     Get SORACOM authentication tokens.
+    
+    Tokens are cached in-process for _TOKEN_TTL seconds.
     '''
     try:
         email, password = get_credentials()
+        key = _credentials_key(email, password)
+        entry = _TOKEN_CACHE.get(key)
+        if entry is not None and time.monotonic() - entry['ts'] < _TOKEN_TTL:
+            return entry['keys']
         
-        headers = {'Content-type': 'application/json'}
         data = {'email': email, 'password': password}
         
         try:
-            response = requests.post('https://g.api.soracom.io/v1/auth',
-                                  headers=headers,
+            response = session.post('https://g.api.soracom.io/v1/auth',
                                   json=data,
                                   timeout=30)
         except requests.exceptions.RequestException as e:
@@ -68,6 +117,8 @@ def get_auth():
         if not api_key or not token:
             raise ApiError('API key or token not found in response')
 
+        with _token_lock:
+            _TOKEN_CACHE[key] = {'keys': (api_key, token), 'ts': time.monotonic()}
         return api_key, token
 
     except (CredentialsError, ApiError) as e:
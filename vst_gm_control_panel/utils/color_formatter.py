@@ -2,6 +2,8 @@
 Ansi color codes for formatting text in the terminal.
 '''
 
+from types import MappingProxyType
+
 
 class ColorFormatter:
     '''
@@ -35,4 +37,19 @@ class ColorFormatter:
     BG_BLUE    = '\033[44m'
     BG_MAGENTA = '\033[45m'
     BG_CYAN    = '\033[46m'
-    BG_WHITE   = '\033[47m'
\ No newline at end of file
+    BG_WHITE   = '\033[47m'
+
+
+# Name -> code lookup, for callers choosing a color by name at runtime
+ColorFormatter.CODES = MappingProxyType({
+    name: code for name, code in vars(ColorFormatter).items()
+    if name.isupper()
+})
+ColorFormatter.by_name = ColorFormatter.CODES.__getitem__
+
+# Pre-joined (foreground, background) pairs
+ColorFormatter.COMBO = MappingProxyType({
+    (fg, bg): ColorFormatter.CODES[fg] + ColorFormatter.CODES[bg]
+    for fg in ColorFormatter.CODES if not fg.startswith('BG_') and fg != 'RESET'
+    for bg in ColorFormatter.CODES if bg.startswith('BG_')
+})
@@ -12,6 +12,8 @@ from typing import Dict, List, Tuple, Optional, Any
 from kivy.logger import Logger
 from kivymd.app import MDApp
 
+from .database_manager import DatabaseManager
+
 
 class CycleStateManager:
     """
@@ -24,7 +26,37 @@ class CycleStateManager:
         self._state_lock = threading.Lock()
         self._pause_event = multiprocessing.Event()
         self._resume_event = multiprocessing.Event()
+        # Live pause state; gm_db is only read once, to pick up a pause
+        # persisted before a restart (_hydrated marks memory authoritative)
         self._current_state = None
+        self._hydrated = False
+        self._gm_db = getattr(self.app, 'gm_db', None)
+        if self._gm_db is not None:
+            self.load_cycle_state()
+    
+    def _db(self):
+        """Return the gm settings database, resolving it lazily if needed."""
+        if self._gm_db is None:
+            if self.app is None:
+                self.app = MDApp.get_running_app()
+            self._gm_db = self.app.gm_db
+        return self._gm_db
+    
+    def _persist_state(self, state_data: Optional[Dict[str, Any]]) -> None:
+        """
+        Write the pause state to gm_db (runs on the database worker thread).
+        
+        Args:
+            state_data: The state to store, or None to clear it
+        """
+        try:
+            if state_data is None:
+                pairs = (('cycle_pause_state', ''), ('cycle_is_paused', 'false'))
+            else:
+                pairs = (('cycle_pause_state', json.dumps(state_data)), ('cycle_is_paused', 'true'))
+            self._db().add_settings_many(pairs)
+        except Exception as e:
+            Logger.error(f'CycleStateManager: Error persisting cycle state: {e}')
         
     def save_cycle_state(self, sequence: List[Tuple[str, float]], current_step: int, 
                         elapsed_time: float, is_manual: bool = False) -> bool:
@@ -41,23 +73,28 @@ class CycleStateManager:
             bool: True if state saved successfully
         """
         try:
+            # Snapshot the steps; the saved state is served from memory, so it
+            # must not change if the caller later mutates its sequence list
+            sequence = tuple(sequence)
+            original_step_duration = sequence[current_step][1] if current_step < len(sequence) else 0
+            state_data = {
+                'sequence': sequence,
+                'current_step': current_step,
+                'elapsed_time': elapsed_time,
+                'is_manual': is_manual,
+                'pause_timestamp': time.time(),
+                'original_step_duration': original_step_duration
+            }
+            
             with self._state_lock:
-                state_data = {
-                    'sequence': sequence,
-                    'current_step': current_step,
-                    'elapsed_time': elapsed_time,
-                    'is_manual': is_manual,
-                    'pause_timestamp': time.time(),
-                    'original_step_duration': sequence[current_step][1] if current_step < len(sequence) else 0
-                }
-                
-                # Store in database
-                self.app.gm_db.add_setting('cycle_pause_state', json.dumps(state_data))
-                self.app.gm_db.add_setting('cycle_is_paused', 'true')
-                
                 self._current_state = state_data
-                Logger.info(f'CycleStateManager: Saved cycle state - step {current_step}, elapsed {elapsed_time}s')
-                return True
+                self._hydrated = True
+                # Queued under the lock so DB writes land in the same order
+                # as the in-memory swaps (the worker queue is FIFO)
+                DatabaseManager.queue_operation(self._persist_state, state_data)
+            
+            Logger.info(f'CycleStateManager: Saved cycle state - step {current_step}, elapsed {elapsed_time}s')
+            return True
                 
         except Exception as e:
             Logger.error(f'CycleStateManager: Error saving cycle state: {e}')
@@ -65,38 +102,56 @@ class CycleStateManager:
     
     def load_cycle_state(self) -> Optional[Dict[str, Any]]:
         """
-        Load the saved cycle state from database.
+        Load the saved cycle state, from memory or else from the database.
         
         Returns:
             Dict containing cycle state or None if no saved state
         """
         try:
             with self._state_lock:
-                is_paused = self.app.gm_db.get_setting('cycle_is_paused', 'false')
-                if is_paused != 'true':
-                    return None
-                    
-                state_json = self.app.gm_db.get_setting('cycle_pause_state')
-                if not state_json:
-                    return None
-                    
-                state_data = json.loads(state_json)
-                self._current_state = state_data
-                Logger.info(f'CycleStateManager: Loaded cycle state - step {state_data.get("current_step", 0)}')
-                return state_data
+                if self._hydrated:
+                    return self._current_state
+            return self._hydrate_from_db()
                 
         except Exception as e:
             Logger.error(f'CycleStateManager: Error loading cycle state: {e}')
             return None
     
+    def _hydrate_from_db(self) -> Optional[Dict[str, Any]]:
+        """
+        Seed the in-memory state from gm_db (once, e.g. after a restart).
+        
+        Returns:
+            Dict containing cycle state or None if no saved state
+        """
+        state_data = None
+        get = self._db().get_setting
+        if get('cycle_is_paused', 'false') == 'true':
+            state_json = get('cycle_pause_state')
+            if state_json:
+                state_data = json.loads(state_json)
+                # JSON stores the (mode, duration) steps as lists
+                state_data['sequence'] = [tuple(step) for step in state_data.get('sequence', [])]
+        
+        with self._state_lock:
+            # A save/clear may have raced the DB read; memory wins
+            if self._hydrated:
+                return self._current_state
+            self._current_state = state_data
+            self._hydrated = True
+        
+        if state_data is not None:
+            Logger.info(f'CycleStateManager: Loaded cycle state - step {state_data.get("current_step", 0)}')
+        return state_data
+    
     def clear_cycle_state(self):
         """Clear the saved cycle state from database."""
         try:
             with self._state_lock:
-                self.app.gm_db.add_setting('cycle_pause_state', '')
-                self.app.gm_db.add_setting('cycle_is_paused', 'false')
                 self._current_state = None
-                Logger.info('CycleStateManager: Cleared cycle state')
+                self._hydrated = True
+                DatabaseManager.queue_operation(self._persist_state, None)
+            Logger.info('CycleStateManager: Cleared cycle state')
                 
         except Exception as e:
             Logger.error(f'CycleStateManager: Error clearing cycle state: {e}')
@@ -104,8 +159,9 @@ class CycleStateManager:
     def is_cycle_paused(self) -> bool:
         """Check if a cycle is currently paused."""
         try:
-            is_paused = self.app.gm_db.get_setting('cycle_is_paused', 'false')
-            return is_paused == 'true'
+            if not self._hydrated:
+                self.load_cycle_state()
+            return self._current_state is not None
         except Exception:
             return False
     
@@ -124,8 +180,8 @@ class CycleStateManager:
             elapsed_time = state_data.get('elapsed_time', 0)
             remaining_time = max(0, original_duration - elapsed_time)
             
-            Logger.debug(f'CycleStateManager: Original duration: {original_duration}s, '
-                        f'elapsed: {elapsed_time}s, remaining: {remaining_time}s')
+            Logger.debug('CycleStateManager: Original duration: %ss, elapsed: %ss, remaining: %ss',
+                         original_duration, elapsed_time, remaining_time)
             return remaining_time
             
         except Exception as e:
@@ -153,17 +209,12 @@ class CycleStateManager:
             # Calculate remaining time for current step
             remaining_time = self.calculate_remaining_time(state_data)
             
-            # Build resume sequence
-            resume_sequence = []
-            
-            # Add current step with remaining time if there's time left
+            # Build resume sequence: all remaining steps, prefixed with the
+            # current step's remaining time if there's time left
+            resume_sequence = list(original_sequence[current_step + 1:])
             if remaining_time > 0:
                 current_mode = original_sequence[current_step][0]
-                resume_sequence.append((current_mode, remaining_time))
-            
-            # Add all remaining steps
-            for i in range(current_step + 1, len(original_sequence)):
-                resume_sequence.append(original_sequence[i])
+                resume_sequence.insert(0, (current_mode, remaining_time))
             
             Logger.info(f'CycleStateManager: Created resume sequence with {len(resume_sequence)} steps')
             return resume_sequence
@@ -184,7 +235,7 @@ class CycleStateManager:
         """
         try:
             Logger.info('CycleStateManager: Initiating cycle pause for GM fault')
-            Logger.debug(f'CycleStateManager: MODE CHANGE - Pausing cycle, current mode: {io_manager.mode}')
+            Logger.debug('CycleStateManager: MODE CHANGE - Pausing cycle, current mode: %s', io_manager.mode)
             
             # Signal the cycle to pause
             self._pause_event.set()
@@ -223,7 +274,8 @@ class CycleStateManager:
                 Logger.warning('CycleStateManager: No saved state found for resume')
                 return False
             
-            Logger.debug(f'CycleStateManager: MODE CHANGE - Resuming from step {state_data.get("current_step", 0)} of {len(state_data.get("sequence", []))} total steps')
+            Logger.debug('CycleStateManager: MODE CHANGE - Resuming from step %s of %s total steps',
+                         state_data.get('current_step', 0), len(state_data.get('sequence', [])))
             
             # Create resume sequence
             resume_sequence = self.create_resume_sequence(state_data)
@@ -233,7 +285,7 @@ class CycleStateManager:
                 return False
             
             Logger.info(f'CycleStateManager: Resuming cycle with {len(resume_sequence)} remaining steps')
-            Logger.debug(f'CycleStateManager: MODE CHANGE - Resume sequence: {[(mode, duration) for mode, duration in resume_sequence]}')
+            Logger.debug('CycleStateManager: MODE CHANGE - Resume sequence: %s', resume_sequence)
             
             # Clear pause events
             self._pause_event.clear()
@@ -241,7 +293,7 @@ class CycleStateManager:
             
             # Start the resume sequence
             is_manual = state_data.get('is_manual', False)
-            Logger.debug(f'CycleStateManager: MODE CHANGE - Starting resume sequence, is_manual: {is_manual}')
+            Logger.debug('CycleStateManager: MODE CHANGE - Starting resume sequence, is_manual: %s', is_manual)
             io_manager.process_sequence(resume_sequence, is_manual)
             
             # Clear the saved state since we're resuming
@@ -253,6 +305,10 @@ class CycleStateManager:
             Logger.error(f'CycleStateManager: Error resuming cycle: {e}')
             return False
     
+    def signal_current_drop(self):
+        """End the GM fault rest period early once the current drop is confirmed."""
+        self._resume_event.set()
+    
     def handle_gm_fault_pause_resume(self, io_manager) -> bool:
         """
         Handle the complete pause-rest-resume cycle for GM faults.
@@ -265,15 +321,19 @@ class CycleStateManager:
         """
         try:
             Logger.info('CycleStateManager: Starting GM fault pause/resume sequence')
+            self._resume_event.clear()
             
             # Step 1: Pause the current cycle
             if not self.pause_cycle(io_manager):
                 Logger.error('CycleStateManager: Failed to pause cycle')
                 return False
             
-            # Step 2: Wait 2 seconds in rest mode to let current drop
+            # Step 2: Wait up to 2 seconds in rest mode to let current drop
             Logger.info('CycleStateManager: Entering 2-second rest period for current drop')
-            time.sleep(2.0)
+            if self._resume_event.wait(timeout=2.0):
+                Logger.info('CycleStateManager: Current drop signalled, ending rest period early')
+            else:
+                Logger.debug('CycleStateManager: Rest period timed out')
             
             # Step 3: Resume the cycle
             if not self.resume_cycle(io_manager):
@@ -8,8 +8,33 @@ for the ESP32 IO Board integration.
 import logging
 import json
 import os
+import struct
+from collections import deque
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_record(record):
+    """Serialize one backfill record as a JSON-Lines row (bytes)."""
+    if orjson is not None:
+        return orjson.dumps(record) + b'\n'
+    return (json.dumps(record, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def _load_record(line):
+    """Parse one JSON-Lines row."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+_OFFSET = struct.Struct('<Q')
+
+
 class DataHandler:
     """
     Data handler for managing ESP32 sensor data, calibration, and backfill operations.
@@ -29,8 +54,81 @@ class DataHandler:
         self.data_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'data')
         os.makedirs(self.data_dir, exist_ok=True)
 
-        # Backfill data storage
-        self.backfill_file = os.path.join(self.data_dir, 'backfill_data.json')
+        # Backfill data storage (JSON Lines, one record per line, append-only)
+        self.backfill_file = os.path.join(self.data_dir, 'backfill_data.jsonl')
+        # Sidecar index: one little-endian uint64 start offset per record
+        self.backfill_index = os.path.join(self.data_dir, 'backfill_data.idx')
+        self._migrate_legacy_backfill()
+
+        # Calibration cache, revalidated against the file's mtime
+        self.cal_file = os.path.join(self.data_dir, 'pressure_calibration.json')
+        self._cal_cache = None
+        self._cal_mtime = 0
+
+    def _migrate_legacy_backfill(self):
+        """
+        Convert a backfill_data.json list from older versions into JSON Lines.
+        """
+        legacy_file = os.path.join(self.data_dir, 'backfill_data.json')
+        if not os.path.exists(legacy_file) or os.path.exists(self.backfill_file):
+            return
+
+        try:
+            with open(legacy_file, 'r') as f:
+                records = json.load(f)
+            self._append_records(records)
+            os.rename(legacy_file, f"{legacy_file}.migrated")
+            self.logger.info(f"Migrated {len(records)} backfill records to {self.backfill_file}")
+        except Exception as e:
+            self.logger.error(f"Failed to migrate legacy backfill data: {e}")
+
+    def _append_records(self, records):
+        """
+        Append records to the backfill file and their offsets to the index.
+
+        The data is written before the index, so after a crash the index can
+        only be short, never point past the end of the data.
+        """
+        with open(self.backfill_file, 'ab') as f:
+            offset = f.tell()
+            rows = []
+            offsets = []
+            for rec in records:
+                row = _dump_record(rec)
+                rows.append(row)
+                offsets.append(_OFFSET.pack(offset))
+                offset += len(row)
+            f.write(b''.join(rows))
+
+        with open(self.backfill_index, 'ab') as idx:
+            idx.write(b''.join(offsets))
+
+    def _tail_offset(self, limit):
+        """
+        Byte offset of the limit-th most recent record according to the index.
+
+        Returns:
+            int or None: Offset to read from, or None if there is no usable index
+        """
+        try:
+            index_size = os.path.getsize(self.backfill_index)
+        except OSError:
+            return None
+
+        if index_size % _OFFSET.size:
+            return None
+
+        count = index_size // _OFFSET.size
+        if count <= limit:
+            return 0
+
+        with open(self.backfill_index, 'rb') as idx:
+            idx.seek((count - limit) * _OFFSET.size)
+            offset, = _OFFSET.unpack(idx.read(_OFFSET.size))
+
+        if offset >= os.path.getsize(self.backfill_file):
+            return None
+        return offset
 
     def save_calibration(self, calibration_value):
         """
@@ -43,16 +141,29 @@ class DataHandler:
             bool: True if saved successfully, False otherwise
         """
         try:
-            cal_file = os.path.join(self.data_dir, 'pressure_calibration.json')
-
             cal_data = {
                 'adc_zero_point': calibration_value,
                 'timestamp': datetime.now().isoformat(),
                 'source': 'esp32'
             }
 
-            with open(cal_file, 'w') as f:
+            # Skip the write when the ESP32 re-reports the stored value
+            cached = self._cal_cache
+            if (cached is not None
+                    and cached.get('adc_zero_point') == calibration_value
+                    and cached.get('source') == cal_data['source']):
+                return True
+
+            # Write to a temp file and swap it in so a crash can't leave a torn file
+            tmp_file = f"{self.cal_file}.tmp"
+            with open(tmp_file, 'w') as f:
                 json.dump(cal_data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.cal_file)
+
+            self._cal_cache = cal_data
+            self._cal_mtime = os.stat(self.cal_file).st_mtime
 
             self.logger.info(f"Saved ESP32 calibration: {calibration_value}")
             return True
@@ -72,21 +183,8 @@ class DataHandler:
             bool: True if saved successfully, False otherwise
         """
         try:
-            # Load existing backfill data if any
-            existing_data = []
-            if os.path.exists(self.backfill_file):
-                try:
-                    with open(self.backfill_file, 'r') as f:
-                        existing_data = json.load(f)
-                except (json.JSONDecodeError, FileNotFoundError):
-                    existing_data = []
-
-            # Add new records
-            existing_data.extend(backfill_records)
-
-            # Save updated data
-            with open(self.backfill_file, 'w') as f:
-                json.dump(existing_data, f, indent=2)
+            # Append new records; existing data is never re-read or rewritten
+            self._append_records(backfill_records)
 
             self.logger.info(f"Saved {len(backfill_records)} backfill records to {self.backfill_file}")
 
@@ -113,13 +211,17 @@ class DataHandler:
             if not os.path.exists(self.backfill_file):
                 return []
 
-            with open(self.backfill_file, 'r') as f:
-                data = json.load(f)
-
-            if limit and isinstance(limit, int):
-                return data[-limit:]  # Return most recent records
+            with open(self.backfill_file, 'rb') as f:
+                if limit and isinstance(limit, int):
+                    offset = self._tail_offset(limit)
+                    if offset is not None:
+                        f.seek(offset)
+                    # The deque still bounds the result if the index is short
+                    lines = deque(f, maxlen=limit)  # Keep only the most recent records
+                else:
+                    lines = f.readlines()
 
-            return data
+            return [_load_record(line) for line in lines if line.strip()]
 
         except Exception as e:
             self.logger.error(f"Failed to read backfill data: {e}")
@@ -133,15 +235,18 @@ class DataHandler:
             bool: True if cleared successfully, False otherwise
         """
         try:
+            suffix = f".backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             if os.path.exists(self.backfill_file):
                 # Instead of deleting, create backup
-                backup_file = f"{self.backfill_file}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                backup_file = f"{self.backfill_file}{suffix}"
                 os.rename(self.backfill_file, backup_file)
                 self.logger.info(f"Backfill data backed up to {backup_file}")
+            if os.path.exists(self.backfill_index):
+                os.rename(self.backfill_index, f"{self.backfill_index}{suffix}")
 
-            # Create empty file
-            with open(self.backfill_file, 'w') as f:
-                json.dump([], f)
+            # Create empty files
+            open(self.backfill_file, 'wb').close()
+            open(self.backfill_index, 'wb').close()
 
             return True
 
@@ -157,13 +262,18 @@ class DataHandler:
             dict or None: Calibration data or None if not found
         """
         try:
-            cal_file = os.path.join(self.data_dir, 'pressure_calibration.json')
-
-            if not os.path.exists(cal_file):
+            try:
+                mtime = os.stat(self.cal_file).st_mtime
+            except FileNotFoundError:
                 return None
 
-            with open(cal_file, 'r') as f:
-                return json.load(f)
+            if self._cal_cache is not None and mtime == self._cal_mtime:
+                return self._cal_cache
+
+            with open(self.cal_file, 'r') as f:
+                self._cal_cache = json.load(f)
+            self._cal_mtime = mtime
+            return self._cal_cache
 
         except Exception as e:
             self.logger.error(f"Failed to read calibration: {e}")
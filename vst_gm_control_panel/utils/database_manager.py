@@ -7,21 +7,41 @@ proper error handling and concurrency support.
 """
 
 # Standard imports
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
 import logging
 import os
-import queue
 import sqlite3
 import threading
 import time
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-# Kivy imports
-from kivymd.app import MDApp
-
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Use absolute path to ensure consistent database location
+# Base directory is always /home/cpx003/vst_gm_control_panel/vst_gm_control_panel/data/db
+_VST_ROOT = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+_BASE_DIR = os.path.join(_VST_ROOT, 'data', 'db')
+
+
+class _ThreadConnections(dict):
+    """
+    Per-thread connection cache that closes its connections when discarded.
+    
+    Each thread's instance lives in DatabaseManager._local, which Python
+    drops when the thread exits, so connections from threads that never call
+    close_thread_connections() are still closed promptly.
+    """
+    
+    def __del__(self):
+        for conn in self.values():
+            try:
+                conn.close()
+            except Exception:
+                pass
+
 
 class DatabaseManager:
     """
@@ -31,9 +51,16 @@ class DatabaseManager:
     connection management, and operation queuing to prevent concurrency issues.
     All database operations are thread-safe using thread-local connections.
     """
-    # Class-level variables for operation queue
-    _operation_queue = queue.Queue()
-    _worker_thread = None
+    # Class-level variables for operation queues: one queue and writer thread
+    # per database file, so writes to unrelated databases don't wait on each
+    # other. Operations not bound to a manager share the default queue.
+    # Each queue is a deque plus a wake-up Event: deque.append/popleft are
+    # atomic, so enqueueing takes no lock.
+    _DEFAULT_QUEUE = 'default'
+    # Per-database queues commit up to this many pending operations at once
+    _MAX_BATCH = 64
+    _operation_queues = {}
+    _worker_threads = {}
     _worker_running = False
     _queue_lock = threading.Lock()
     
@@ -43,6 +70,49 @@ class DatabaseManager:
     # Tracking all active managers for cleanup
     _all_managers = set()
     _managers_lock = threading.Lock()
+    
+    # Database files already switched to WAL (journal_mode persists in the file)
+    _wal_paths = set()
+    
+    # (db_path, table_name) pairs whose CREATE TABLE IF NOT EXISTS has run
+    _initialized_tables = set()
+    
+    # Per-operation SQL, formatted once per table name into _sql_cache; the
+    # identical strings also hit each connection's prepared-statement cache
+    _SQL_TEMPLATES = {
+        'add_setting': 'INSERT OR REPLACE INTO {table} (key, value) VALUES (?, ?);',
+        'remove_setting': 'DELETE FROM {table} WHERE key = ?;',
+        'get_setting': 'SELECT value FROM {table} WHERE key = ?;',
+        # Store the default unless a non-NULL value exists; returns a row
+        # only when the default was written
+        'add_setting_if_missing': (
+            'INSERT INTO {table} (key, value) VALUES (?, ?) '
+            'ON CONFLICT(key) DO UPDATE SET value = excluded.value WHERE value IS NULL '
+            'RETURNING key;'
+        ),
+        'get_all_settings': 'SELECT key, value FROM {table};',
+        'get_permissions': 'SELECT level, screen, access FROM {table} WHERE level = ?;',
+        'check_permissions': 'SELECT level FROM {table} WHERE access = ?;',
+        'add_translation': 'INSERT OR REPLACE INTO {table} (language, key, value) VALUES (?, ?, ?);',
+        'remove_translation': 'DELETE FROM {table} WHERE language = ? AND key = ?;',
+        'translate': 'SELECT value FROM {table} WHERE language = ? AND key = ?;',
+        'load_translations': 'SELECT key, value FROM {table} WHERE language = ?;',
+        'add_notification': 'INSERT INTO {table} (datetime, notification) VALUES (?, ?);',
+    }
+    _sql_cache = {}
+    
+    # UPSERT ... RETURNING needs SQLite 3.35+; older builds use SELECT + INSERT
+    _HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+    
+    # Per-connection tuning, applied to every new connection. Sizes are kept
+    # modest for the Pi: 8 MB page cache, 64 MB of mmap address space.
+    _CONNECTION_PRAGMAS = (
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA cache_size=-8000;"
+        "PRAGMA mmap_size=67108864;"
+        "PRAGMA busy_timeout=30000;"
+    )
 
     def __init__(self, db_name='app.db', table_name='gm'):
         """
@@ -52,22 +122,20 @@ class DatabaseManager:
             db_name: Name of the database file
             table_name: Name of the table to use for operations
         """
-        self.app = MDApp.get_running_app()
         self.db_name = db_name
         self.table_name = table_name
         
-        # Use absolute path to ensure consistent database location
-        # Base directory is always /home/cpx003/vst_gm_control_panel/vst_gm_control_panel/data/db
-        vst_root = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
-        self.base_dir = os.path.join(vst_root, 'data', 'db')
+        self._sql = self._sql_for(table_name)
+        
+        self.base_dir = _BASE_DIR
         
-        # Ensure the directory exists
-        if not os.path.exists(self.base_dir):
-            os.makedirs(self.base_dir)
-            
         # Set absolute path for the database
         self.db_path = os.path.join(self.base_dir, self.db_name)
         
+        # Ensure the directory exists (only needed before the table is first set up)
+        if (self.db_path, self.table_name) not in self._initialized_tables:
+            os.makedirs(self.base_dir, exist_ok=True)
+        
         # Register this manager instance for cleanup
         with self._managers_lock:
             self._all_managers.add(self)
@@ -88,7 +156,65 @@ class DatabaseManager:
         """
         return cls(db_name=db_name, table_name=table_name)
 
-    def get_thread_connection(self):
+    def _open_connection(self):
+        """
+        Open and tune a new SQLite connection to this manager's database.
+        
+        Returns:
+            A new SQLite connection object
+        """
+        connection = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,  # Autocommit mode
+            check_same_thread=False,  # Allow thread transfer (we manage it properly)
+            cached_statements=256  # Prepared statements kept per connection
+        )
+        connection.row_factory = sqlite3.Row
+        # busy_timeout (set in the pragmas) prevents indefinite blocking
+        connection.executescript(self._CONNECTION_PRAGMAS)
+        if self.db_path not in self._wal_paths:
+            connection.execute("PRAGMA journal_mode=WAL;")
+            self._wal_paths.add(self.db_path)
+        return connection
+
+    def _open_ro_connection(self):
+        """
+        Open a read-only SQLite connection to this manager's database.
+        
+        Returns:
+            A new read-only SQLite connection object
+        """
+        connection = sqlite3.connect(
+            f"file:{self.db_path}?mode=ro&cache=private",
+            uri=True,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256
+        )
+        connection.row_factory = sqlite3.Row
+        connection.executescript(self._CONNECTION_PRAGMAS + "PRAGMA query_only=ON;")
+        return connection
+
+    @classmethod
+    def _sql_for(cls, table_name):
+        """
+        Get the operation -> SQL mapping for a table, formatting it on first use.
+        
+        Args:
+            table_name: Name of the table
+            
+        Returns:
+            Dict of SQL strings keyed by operation name
+        """
+        sql = cls._sql_cache.get(table_name)
+        if sql is None:
+            sql = cls._sql_cache[table_name] = {
+                op: template.format(table=table_name)
+                for op, template in cls._SQL_TEMPLATES.items()
+            }
+        return sql
+
+    def get_thread_connection(self, readonly=False):
         """
         Get a database connection for the current thread.
         
@@ -96,6 +222,9 @@ class DatabaseManager:
         SQLite's thread affinity requirements. Connections are cached in
         thread-local storage for reuse.
         
+        Args:
+            readonly: Return the thread's separate read-only connection
+            
         Returns:
             A SQLite connection object specific to the current thread
         """
@@ -104,55 +233,51 @@ class DatabaseManager:
         
         # Create thread-local storage attribute if it doesn't exist
         if not hasattr(self._local, 'connections'):
-            self._local.connections = {}
+            self._local.connections = _ThreadConnections()
         
         # Create connection key that's truly unique per thread AND database
-        conn_key = f"{self.db_path}:{thread_id}"
+        conn_key = f"{self.db_path}:ro:{thread_id}" if readonly else f"{self.db_path}:{thread_id}"
         
-        # Create new connection if none exists for this thread
-        if conn_key not in self._local.connections or self._local.connections[conn_key] is None:
-            try:
-                # Create connection with proper SQLite settings
-                connection = sqlite3.connect(
-                    self.db_path,
-                    isolation_level=None,  # Autocommit mode
-                    check_same_thread=False,  # Allow thread transfer (we manage it properly)
-                    timeout=30.0  # Prevent indefinite blocking
-                )
-                connection.row_factory = sqlite3.Row
-                
-                # Test the connection immediately
-                connection.execute("SELECT 1")
-                
-                # Store in thread-local storage
-                self._local.connections[conn_key] = connection
-                logger.debug(f"Created new thread-local connection for thread {thread_id}")
-                
-            except sqlite3.DatabaseError as e:
-                logger.error(f"Error creating database connection: {e}")
-                raise
+        # Reuse the cached connection; a dead one is detected when a query
+        # fails (see execute_query) rather than probed on every call
+        connection = self._local.connections.get(conn_key)
+        if connection is not None:
+            return connection
         
-        # Validate existing connection is still alive
+        # Create new connection if none exists for this thread
         try:
-            self._local.connections[conn_key].execute("SELECT 1")
-            return self._local.connections[conn_key]
-        except sqlite3.Error:
-            # Connection is dead, recreate it
-            logger.warning(f"Recreating dead connection for thread {thread_id}")
+            # Create connection with proper SQLite settings
+            connection = self._open_ro_connection() if readonly else self._open_connection()
+            
+            # Store in thread-local storage
+            self._local.connections[conn_key] = connection
+            logger.debug(f"Created new thread-local connection for thread {thread_id}")
+            return connection
+            
+        except sqlite3.DatabaseError as e:
+            logger.error(f"Error creating database connection: {e}")
+            raise
+
+    def _drop_thread_connection(self, readonly=False):
+        """Close and forget this thread's connection so the next call reconnects."""
+        thread_id = threading.get_ident()
+        conn_key = f"{self.db_path}:ro:{thread_id}" if readonly else f"{self.db_path}:{thread_id}"
+        connection = getattr(self._local, 'connections', {}).pop(conn_key, None)
+        if connection is not None:
             try:
-                connection = sqlite3.connect(
-                    self.db_path,
-                    isolation_level=None,
-                    check_same_thread=False,
-                    timeout=30.0
-                )
-                connection.row_factory = sqlite3.Row
-                connection.execute("SELECT 1")  # Test immediately
-                self._local.connections[conn_key] = connection
-                return connection
-            except sqlite3.DatabaseError as e:
-                logger.error(f"Failed to recreate connection: {e}")
-                raise
+                connection.close()
+            except sqlite3.Error:
+                pass
+
+    @staticmethod
+    def _is_dead_connection_error(error):
+        """Return True if error means the connection itself is unusable."""
+        message = str(error).lower()
+        if isinstance(error, sqlite3.ProgrammingError):
+            return 'closed' in message
+        if isinstance(error, sqlite3.OperationalError):
+            return 'disk i/o' in message or 'unable to open' in message
+        return False
 
     def __enter__(self):
         """
@@ -181,12 +306,58 @@ class DatabaseManager:
         """
         conn = self.get_thread_connection()
         
+        # Inside transaction() the outermost block commits or rolls back
+        if self._transaction_active():
+            return
+        
         # Handle transaction
         if exc_type or exc_value or traceback:
             conn.rollback()
         else:
             conn.commit()
 
+    def _transaction_active(self):
+        """Return True if transaction() is open for this thread's connection."""
+        active = getattr(self._local, 'transactions', None)
+        return bool(active) and self.db_path in active
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several writes into a single SQLite transaction (one commit).
+        
+        Every manager for the same database file shares this thread's
+        connection, so writes made through other managers (other tables in
+        the same file) inside the block are part of the same transaction.
+        Nested use joins the outer transaction.
+        
+        The write lock is taken up front (BEGIN IMMEDIATE), where busy_timeout
+        waits for it. A deferred BEGIN that reads first fails with an
+        unretried SQLITE_BUSY_SNAPSHOT on its first write if another
+        connection committed in between.
+        
+        Yields:
+            The thread-local SQLite connection
+        """
+        conn = self.get_thread_connection()
+        if self._transaction_active():
+            yield conn
+            return
+        
+        if not hasattr(self._local, 'transactions'):
+            self._local.transactions = set()
+        conn.execute("BEGIN IMMEDIATE")
+        self._local.transactions.add(self.db_path)
+        try:
+            yield conn
+        except BaseException:
+            self._local.transactions.discard(self.db_path)
+            conn.rollback()
+            raise
+        else:
+            self._local.transactions.discard(self.db_path)
+            conn.commit()
+
     def create_connection(self):
         """
         Create a connection to the database.
@@ -239,8 +410,9 @@ class DatabaseManager:
                         logger.error(f"Error closing connection {conn_key}: {e}")
             
             # Remove connections for this thread
-            cls._local.connections = {k: v for k, v in cls._local.connections.items() 
-                                     if not k.endswith(f":{thread_id}")}
+            # (in place: a discarded _ThreadConnections closes what it holds)
+            for conn_key in [k for k in cls._local.connections if k.endswith(f":{thread_id}")]:
+                del cls._local.connections[conn_key]
 
     @classmethod
     def close_all_connections(cls):
@@ -259,7 +431,7 @@ class DatabaseManager:
                     logger.error(f"Error closing connection {conn_key}: {e}")
             
             # Clear all connections
-            cls._local.connections = {}
+            cls._local.connections.clear()
 
     def execute_query(
         self,
@@ -267,6 +439,7 @@ class DatabaseManager:
         params=(),
         fetchall=False,
         default_value=None,
+        readonly=False,
     ):
         """
         Execute a query on the database using thread-local connections.
@@ -276,38 +449,117 @@ class DatabaseManager:
             params: Parameters for the query
             fetchall: Whether to fetch all results
             default_value: Default value if no results found
+            readonly: Run a SELECT on the thread's read-only connection
             
         Returns:
             Query results based on fetchall parameter
         """
-        try:
-            with self as cursor:
-                cursor.execute(query, params)
-                if fetchall:
-                    results = cursor.fetchall()
-                    if results and len(results[0]) == 1:
-                        return [result[0] for result in results] if results else default_value
-                    return dict(results) if results else default_value
-                result = cursor.fetchone()
-                return result[0] if result else default_value
-        except sqlite3.DatabaseError as e:
-            logger.error(f"Database error executing query: {e}")
-            raise
+        # Inside transaction() reads must see its uncommitted writes, so they
+        # stay on the read/write connection
+        readonly = readonly and not self._transaction_active()
+        for attempt in range(2):
+            try:
+                if readonly:
+                    cursor = self.get_thread_connection(readonly=True).cursor()
+                    try:
+                        return self._fetch_results(cursor, query, params, fetchall, default_value)
+                    finally:
+                        cursor.close()
+                with self as cursor:
+                    return self._fetch_results(cursor, query, params, fetchall, default_value)
+            except sqlite3.DatabaseError as e:
+                # Reconnect and retry once, unless inside transaction() where
+                # a retry on a fresh connection would break atomicity
+                if (attempt == 0 and self._is_dead_connection_error(e)
+                        and not self._transaction_active()):
+                    logger.warning(f"Recreating dead connection for thread {threading.get_ident()}: {e}")
+                    self._drop_thread_connection(readonly)
+                    continue
+                logger.error(f"Database error executing query: {e}")
+                raise
+
+    @staticmethod
+    def _fetch_results(cursor, query, params, fetchall, default_value):
+        """
+        Execute query on cursor and shape the results for execute_query.
+        
+        Returns:
+            A list (one column) or dict (two columns) of rows when fetchall,
+            otherwise the first column of the first row
+        """
+        if fetchall:
+            # Plain tuples are cheaper to build than sqlite3.Row
+            cursor.row_factory = None
+        cursor.execute(query, params)
+        if fetchall:
+            results = cursor.fetchall()
+            if not results:
+                return default_value
+            if len(cursor.description) == 1:
+                return [result[0] for result in results]
+            return dict(results)
+        result = cursor.fetchone()
+        return result[0] if result else default_value
 
     def create_table_if_not_exists(self):
         '''
         Create the table if it does not exist.
         '''
+        table_key = (self.db_path, self.table_name)
+        if table_key in self._initialized_tables:
+            return
         if 'notifications' in self.db_name:
             self.execute_query(
             f'''CREATE TABLE IF NOT EXISTS {self.table_name}
             (id INTEGER PRIMARY KEY, datetime TEXT, notification TEXT);'''
             )
         else:
+            # Lookups are always by key, so store rows in the key's own B-tree
             self.execute_query(
                 f'''CREATE TABLE IF NOT EXISTS {self.table_name}
-                (id INTEGER PRIMARY KEY, key TEXT UNIQUE, value TEXT);'''
+                (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;'''
             )
+            self._migrate_to_without_rowid()
+        self._initialized_tables.add(table_key)
+
+    def _migrate_to_without_rowid(self):
+        '''
+        Rebuild an older id-keyed settings or translations table as WITHOUT ROWID.
+        
+        Settings tables (id, key, value) become (key PRIMARY KEY, value).
+        Translations tables (id, language, key, value) become
+        PRIMARY KEY(language, key); they had no unique constraint, so when a
+        key was stored more than once the oldest row (lowest id) is kept,
+        which is the one translate() has been returning.
+        Tables with any other layout are left alone.
+        '''
+        table = self.table_name
+        conn = self.get_thread_connection()
+        columns = [row[1] for row in conn.execute(f'PRAGMA table_info({table});')]
+        if columns == ['id', 'key', 'value']:
+            schema = '(key TEXT PRIMARY KEY, value TEXT)'
+            copy_columns = 'key, value'
+            not_null = 'key IS NOT NULL'
+        elif columns == ['id', 'language', 'key', 'value']:
+            schema = '(language TEXT, key TEXT, value TEXT, PRIMARY KEY (language, key))'
+            copy_columns = 'language, key, value'
+            not_null = 'language IS NOT NULL AND key IS NOT NULL'
+        else:
+            return
+        
+        try:
+            with self.transaction():
+                conn.execute(f'DROP TABLE IF EXISTS {table}_new;')
+                conn.execute(f'CREATE TABLE {table}_new {schema} WITHOUT ROWID;')
+                conn.execute(
+                    f'INSERT OR REPLACE INTO {table}_new ({copy_columns}) '
+                    f'SELECT {copy_columns} FROM {table} WHERE {not_null} ORDER BY id DESC;'
+                )
+                conn.execute(f'DROP TABLE {table};')
+                conn.execute(f'ALTER TABLE {table}_new RENAME TO {table};')
+            logger.info(f"Migrated table {table} in {self.db_name} to WITHOUT ROWID")
+        except sqlite3.DatabaseError as e:
+            logger.error(f"Failed to migrate table {table} to WITHOUT ROWID: {e}")
 
     def add_setting(self, key, value):
         '''
@@ -317,10 +569,17 @@ class DatabaseManager:
         - key: The key for the setting (str).
         - value: The value for the setting (str).
         '''
-        self.execute_query(
-            f'INSERT OR REPLACE INTO {self.table_name} (key, value) VALUES (?, ?);',
-            (key, value)
-        )
+        self.execute_query(self._sql['add_setting'], (key, value))
+
+    def add_settings_many(self, pairs):
+        '''
+        Purpose:
+        - Add several settings to the database in a single transaction.
+        Parameters:
+        - pairs: Iterable of (key, value) tuples (str, str).
+        '''
+        with self.transaction() as conn:
+            conn.executemany(self._sql['add_setting'], pairs)
 
     def remove_setting(self, key):
         '''
@@ -330,7 +589,7 @@ class DatabaseManager:
         - key: The key for the setting (str).
         '''
         self.execute_query(
-            f'DELETE FROM {self.table_name} WHERE key = ?;',
+            self._sql['remove_setting'],
             (key,)
         )
 
@@ -344,11 +603,17 @@ class DatabaseManager:
         Returns:
         - Any: The value of the setting.
         '''
-        result = self.execute_query(
-            f'SELECT value FROM {self.table_name} WHERE key = ?;',
-            (key,)
-        )
+        result = self.execute_query(self._sql['get_setting'], (key,), readonly=True)
         if result is None:
+            # Missing (or NULL): store the default in one conditional upsert,
+            # so a value written concurrently by another thread isn't clobbered
+            if self._HAS_RETURNING:
+                written = self.execute_query(
+                    self._sql['add_setting_if_missing'], (key, default_value), default_value=False
+                )
+                if written is False:
+                    return self.execute_query(self._sql['get_setting'], (key,))
+                return default_value
             result = default_value
             self.add_setting(key, result)
         return result
@@ -363,8 +628,9 @@ class DatabaseManager:
         - Dict or Any: The results of the query.
         '''
         results = self.execute_query(
-            f'SELECT key, value FROM {self.table_name};',
-            fetchall=True
+            self._sql['get_all_settings'],
+            fetchall=True,
+            readonly=True
         )
         return results if results else default_value
 
@@ -373,8 +639,9 @@ class DatabaseManager:
         Find a value in the database.
         '''
         return self.execute_query(
-            f'SELECT level, screen, access FROM {self.table_name} WHERE level = ?;',
+            self._sql['get_permissions'],
             (value,),
+            readonly=True
         )
 
     def check_permissions(self, value):
@@ -385,8 +652,9 @@ class DatabaseManager:
         try:
             # Get the level for this password by checking the access column
             level = self.execute_query(
-                f'SELECT level FROM {self.table_name} WHERE access = ?;',
-                (str(value),)  # Ensure value is converted to string for comparison
+                self._sql['check_permissions'],
+                (str(value),),  # Ensure value is converted to string for comparison
+                readonly=True
             )
             
             # If no level found, return None
@@ -409,9 +677,28 @@ class DatabaseManager:
         - key: The key for the translation (str).
         - value: The value for the translation (str).
         '''
-        self.execute_query(
-            f'INSERT OR REPLACE INTO {self.table_name} (language, key, value) VALUES (?, ?, ?);',
-            (language, key, value)
+        self.execute_query(self._sql['add_translation'], (language, key, value))
+
+    def add_translations_many(self, rows):
+        '''
+        Purpose:
+        - Add several translations to the database in a single transaction.
+        Parameters:
+        - rows: Iterable of (language, key, value) tuples (str, str, str).
+        '''
+        with self.transaction() as conn:
+            conn.executemany(self._sql['add_translation'], rows)
+
+    def load_language_file(self, language, translations):
+        '''
+        Purpose:
+        - Add all translations for one language in a single transaction.
+        Parameters:
+        - language: The language for the translations (str).
+        - translations: Mapping of translation keys to values (dict).
+        '''
+        self.add_translations_many(
+            (language, key, value) for key, value in translations.items()
         )
 
     def remove_translation(self, language, key):
@@ -423,7 +710,7 @@ class DatabaseManager:
         - key: The key for the translation (str).
         '''
         self.execute_query(
-            f'DELETE FROM {self.table_name} WHERE language = ? AND key = ?;',
+            self._sql['remove_translation'],
             (language, key,)
         )
 
@@ -438,10 +725,7 @@ class DatabaseManager:
         Returns:
         - Any: The value of the translation.
         '''
-        result = self.execute_query(
-            f'SELECT value FROM {self.table_name} WHERE language = ? AND key = ?;',
-            (language, key,)
-        )
+        result = self.execute_query(self._sql['translate'], (language, key), readonly=True)
         return result if result else default_value
 
     def load_translations(self, language, default_value=None):
@@ -455,9 +739,10 @@ class DatabaseManager:
         - Dict or Any: The results of the query.
         '''
         results = self.execute_query(
-            f'SELECT key, value FROM {self.table_name} WHERE language = ?;',
+            self._sql['load_translations'],
             (language,),
-            fetchall=True
+            fetchall=True,
+            readonly=True
         )
         return results if results else default_value
 
@@ -470,68 +755,155 @@ class DatabaseManager:
             notification: The notification text to store
         """
         self.execute_query(
-            f'INSERT INTO {self.table_name} (datetime, notification) VALUES (?, ?);',
+            self._sql['add_notification'],
             (datetime, notification)
         )
         
     # Queue-based operation methods
     
     @classmethod
-    def initialize_worker(cls):
+    def initialize_worker(cls, key=_DEFAULT_QUEUE):
         """
-        Start the background worker thread if not already running.
+        Start the background worker thread for a queue if not already running.
         
         This method starts a daemon thread that processes database operations
         from the queue, which helps prevent database contention issues.
+        
+        Args:
+            key: Queue to serve (a database path, or the default queue)
+            
+        Returns:
+            The (deque, Event) operation queue for key
         """
+        operation_queue = cls._operation_queues.get(key)
+        worker = cls._worker_threads.get(key)
+        if operation_queue is not None and worker is not None and worker.is_alive():
+            return operation_queue
+        
         with cls._queue_lock:
-            if cls._worker_thread is None or not cls._worker_thread.is_alive():
+            operation_queue = cls._operation_queues.get(key)
+            if operation_queue is None:
+                operation_queue = cls._operation_queues[key] = (deque(), threading.Event())
+            worker = cls._worker_threads.get(key)
+            if worker is None or not worker.is_alive():
                 cls._worker_running = True
-                cls._worker_thread = threading.Thread(
+                name = "DatabaseWorker" if key == cls._DEFAULT_QUEUE else f"DatabaseWorker-{os.path.basename(key)}"
+                worker = cls._worker_threads[key] = threading.Thread(
                     target=cls._process_queue,
+                    args=(operation_queue, key != cls._DEFAULT_QUEUE),
                     daemon=True,
-                    name="DatabaseWorker"
+                    name=name
                 )
-                cls._worker_thread.start()
-                logger.info("Database worker thread started")
+                worker.start()
+                logger.info(f"Database worker thread started: {name}")
+            return operation_queue
     
     @classmethod
-    def _process_queue(cls):
+    def _process_queue(cls, operation_queue, batched=False):
         """
-        Process operations from the queue in background thread.
+        Process operations from a queue in background thread.
         
         This method runs in a separate thread and processes database operations
         sequentially to prevent concurrency issues. Each operation gets its own
         database connection to ensure thread safety.
+        
+        Args:
+            operation_queue: The (deque, Event) queue this worker drains
+            batched: Commit pending operations together (per-database queues,
+                where every operation is a method of a manager for that file)
+        """
+        operations, wakeup = operation_queue
+        try:
+            while cls._worker_running:
+                # Wait with 1-second timeout to allow checking _worker_running.
+                # Clear before draining so an append racing the drain re-arms it.
+                wakeup.wait(timeout=1.0)
+                wakeup.clear()
+                while operations:
+                    batch = [operations.popleft()]
+                    if batched:
+                        while operations and len(batch) < cls._MAX_BATCH:
+                            batch.append(operations.popleft())
+                    cls._run_batch(batch, batched)
+        finally:
+            cls.close_thread_connections()
+    
+    @classmethod
+    def _run_batch(cls, batch, batched):
+        """
+        Execute queued operations, in one transaction if batched.
+        
+        Callbacks fire only after the operations (and any commit) succeed.
+        If anything in a batch fails, its transaction is rolled back and the
+        operations are replayed one at a time, in order, so a single failure
+        never drops the other writes.
+        
+        Args:
+            batch: List of (operation, args, kwargs, callback) tuples
+            batched: Wrap the batch in a single transaction
         """
-        while cls._worker_running:
+        completed = []
+        
+        def run_operation(operation, args, kwargs, callback):
+            operation_name = operation.__name__
+            logger.debug(f"Processing queued operation: {operation_name}")
+            
+            # Execute the operation with thread-local handling
+            result = cls._execute_in_worker_thread(operation, *args, **kwargs)
+            completed.append((callback, result))
+            
+            logger.debug(f"Completed queued operation: {operation_name}")
+        
+        if batched:
             try:
-                # Get operation with 1-second timeout to allow checking _worker_running
-                operation, args, kwargs, callback = cls._operation_queue.get(timeout=1.0)
-                
+                with cls._worker_manager(batch[0][0].__self__).transaction():
+                    for item in batch:
+                        run_operation(*item)
+                batch = ()
+            except Exception as e:
+                logger.error(f"Error in batch of {len(batch)} queued operations, "
+                             f"retrying individually: {e}")
+                completed.clear()
+        
+        for item in batch:
+            try:
+                run_operation(*item)
+            except Exception as e:
+                # Log error but continue processing queue
+                logger.error(f"Error processing queued operation {item[0].__name__}: {e}")
+        
+        # Call the callbacks with the results if provided
+        for callback, result in completed:
+            if callback:
                 try:
-                    # Extract operation info
-                    operation_name = operation.__name__
-                    logger.debug(f"Processing queued operation: {operation_name}")
-                    
-                    # Execute the operation with thread-local handling
-                    result = cls._execute_in_worker_thread(operation, *args, **kwargs)
-                    
-                    # Call the callback with the result if provided
-                    if callback:
-                        callback(result)
-                        
-                    logger.debug(f"Completed queued operation: {operation_name}")
+                    callback(result)
                 except Exception as e:
-                    # Log error but continue processing queue
                     logger.error(f"Error processing queued operation: {e}")
-                finally:
-                    # Mark task as done even if it failed
-                    cls._operation_queue.task_done()
-                    
-            except queue.Empty:
-                # Normal timeout, just continue
-                pass
+    
+    @classmethod
+    def _worker_manager(cls, instance):
+        """
+        Get this worker thread's manager for the same database and table as instance.
+        
+        The manager is created on first use and reused for later operations.
+        
+        Args:
+            instance: The DatabaseManager an operation was queued on
+            
+        Returns:
+            A DatabaseManager owned by the current worker thread
+        """
+        worker_managers = getattr(cls._local, 'worker_managers', None)
+        if worker_managers is None:
+            worker_managers = cls._local.worker_managers = {}
+        manager_key = (instance.db_name, instance.table_name)
+        thread_db = worker_managers.get(manager_key)
+        if thread_db is None:
+            thread_db = worker_managers[manager_key] = DatabaseManager(
+                db_name=instance.db_name,
+                table_name=instance.table_name
+            )
+        return thread_db
     
     @classmethod
     def _execute_in_worker_thread(cls, operation, *args, **kwargs):
@@ -555,11 +927,8 @@ class DatabaseManager:
             instance = operation.__self__
             method_name = operation.__name__
             
-            # Create a new database manager instance for this thread with the same parameters
-            thread_db = DatabaseManager(
-                db_name=instance.db_name, 
-                table_name=instance.table_name
-            )
+            # Reuse this worker thread's manager for the same database and table
+            thread_db = cls._worker_manager(instance)
             
             # Get the corresponding method on the thread-local instance
             thread_method = getattr(thread_db, method_name)
@@ -573,10 +942,12 @@ class DatabaseManager:
     @classmethod
     def queue_operation(cls, operation, *args, callback=None, **kwargs):
         """
-        Queue a database operation to be executed on the worker thread.
+        Queue a database operation to be executed on a worker thread.
         
         This method is the primary way to safely execute database operations
-        in response to signals or other asynchronous events.
+        in response to signals or other asynchronous events. Methods bound to
+        a DatabaseManager go to that database's writer thread; anything else
+        goes to the default queue. Each queue runs in FIFO order.
         
         Args:
             operation: The function to execute
@@ -584,11 +955,14 @@ class DatabaseManager:
             callback: Optional function to call with the result
             **kwargs: Keyword arguments to pass to the operation
         """
-        # Ensure worker is running
-        cls.initialize_worker()
+        # Pick the queue for the operation's database and ensure its worker is running
+        instance = getattr(operation, '__self__', None)
+        key = instance.db_path if isinstance(instance, DatabaseManager) else cls._DEFAULT_QUEUE
+        operations, wakeup = cls.initialize_worker(key)
         
         # Add operation to queue
-        cls._operation_queue.put((operation, args, kwargs, callback))
+        operations.append((operation, args, kwargs, callback))
+        wakeup.set()
         logger.debug(f"Operation {operation.__name__} queued")
     
     @classmethod
@@ -597,7 +971,10 @@ class DatabaseManager:
         Execute a database operation with retry logic.
         
         This method attempts to execute a database operation and retries
-        on transient errors like database locks.
+        when SQLite reports a transiently malformed image. Lock contention
+        is not retried here: every connection sets busy_timeout, so SQLite
+        already waits for the lock internally and returns as soon as it
+        clears; "database is locked" means that wait has expired.
         
         Args:
             operation: Function to execute
@@ -620,8 +997,7 @@ class DatabaseManager:
                 
                 # Check if this is a retriable error
                 error_msg = str(e).lower()
-                if ("database is locked" in error_msg or 
-                    "database disk image is malformed" in error_msg):
+                if "database disk image is malformed" in error_msg:
                     
                     # Use exponential backoff for retries
                     wait_time = retry_delay * (2 ** attempt)
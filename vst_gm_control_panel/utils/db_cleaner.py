@@ -3,6 +3,7 @@ Database cleaner module for managing database size.
 '''
 
 from datetime import datetime
+import threading
 from kivy.logger import Logger
 
 
@@ -11,6 +12,14 @@ class DatabaseCleaner:
     Handles cleanup of database tables to prevent excessive growth.
     '''
     
+    # Deleted rows per database file before free pages are reclaimed
+    VACUUM_DELETE_THRESHOLD = 10000
+    # Free pages released per incremental vacuum
+    INCREMENTAL_VACUUM_PAGES = 1000
+    # Cumulative deletes since the last reclaim, keyed by database path
+    _pending_vacuum_deletes = {}
+    _pending_vacuum_lock = threading.Lock()
+    
     def __init__(self, db_manager, table_name=None, config=None, max_records=None):
         '''
         Initialize the database cleaner.
@@ -31,15 +40,162 @@ class DatabaseCleaner:
                 # Fall back to old config format
                 data_config = config['data_management']
                 self.max_records = data_config.get('notifications_max_records', self.max_records)
+        
+        # Table name and limit are fixed from here on, so build the SQL once
+        self._build_queries()
     
+    def _build_queries(self):
+        '''Pre-format the per-table SQL used by the cleanup methods.'''
+        table = self.table_name
+        # Existence of the (max_records + 1)-th row, usable alone or inside a batch query
+        self._exists_sql = f"EXISTS (SELECT 1 FROM {table} LIMIT 1 OFFSET {int(self.max_records)})"
+        self._needs_cleanup_sql = f"SELECT {self._exists_sql};"
+        self._count_sql = f"SELECT COUNT(*) FROM {table};"
+        # Delete oldest records based on datetime column
+        # Assuming the table has an 'id' column and a 'datetime' column for sorting
+        self._delete_sql = f"""
+                DELETE FROM {table}
+                WHERE id IN (
+                    SELECT id FROM {table}
+                    ORDER BY datetime ASC
+                    LIMIT ?
+                );
+            """
+        # Same trim without a prior COUNT: delete everything past the newest max_records
+        self._trim_sql = f"""
+                DELETE FROM {table}
+                WHERE id IN (
+                    SELECT id FROM {table}
+                    ORDER BY datetime DESC
+                    LIMIT -1 OFFSET {int(self.max_records)}
+                );
+            """
+    
+    def needs_cleanup(self):
+        '''
+        Return True if the table holds more than max_records rows.
+
+        Probes for the (max_records + 1)-th row instead of running a full
+        COUNT, so the check stops as soon as the limit is exceeded.
+        '''
+        try:
+            return bool(self.db_manager.execute_query(self._needs_cleanup_sql))
+        except Exception as e:
+            Logger.error(f"Error checking table size for {self.table_name}: {e}")
+            return False
+
+    @staticmethod
+    def select_needing_cleanup(cleaners):
+        '''
+        Return the subset of cleaners whose tables are over their limit.
+
+        Cleaners that share a database file are checked with a single
+        UNION ALL query (one round-trip per database instead of one per
+        table). If the combined query fails, e.g. because one of the tables
+        does not exist, each cleaner in that group is probed individually.
+        '''
+        groups = {}
+        for cleaner in cleaners:
+            groups.setdefault(cleaner.db_manager.db_path, []).append(cleaner)
+
+        needing = set()
+        for group in groups.values():
+            # Table names and limits are trusted config values, not user input
+            batch_query = " UNION ALL ".join(
+                f"SELECT {i}, {c._exists_sql}"
+                for i, c in enumerate(group)
+            )
+            try:
+                results = group[0].db_manager.execute_query(batch_query, fetchall=True, default_value={})
+                needing.update(id(group[i]) for i, flag in results.items() if flag)
+            except Exception as e:
+                if __debug__:
+                    Logger.debug("Batched cleanup check failed, checking tables individually: %s", e)
+                needing.update(id(c) for c in group if c.needs_cleanup())
+
+        return [c for c in cleaners if id(c) in needing]
+
+    @classmethod
+    def _record_deletes(cls, db_manager, deleted):
+        '''
+        Add to the database's pending-delete total and reclaim space past the threshold.
+
+        Vacuuming after every cleanup rewrites the whole file each time, so
+        free pages are only released once enough rows have been removed.
+        '''
+        if deleted <= 0:
+            return
+        with cls._pending_vacuum_lock:
+            pending = cls._pending_vacuum_deletes.get(db_manager.db_path, 0) + deleted
+            if pending < cls.VACUUM_DELETE_THRESHOLD:
+                cls._pending_vacuum_deletes[db_manager.db_path] = pending
+                return
+            cls._pending_vacuum_deletes[db_manager.db_path] = 0
+        cls.reclaim_space(db_manager)
+
+    @classmethod
+    def reclaim_space(cls, db_manager):
+        '''
+        Release free pages back to the filesystem.
+
+        Uses PRAGMA incremental_vacuum when the database is in incremental
+        auto-vacuum mode. Otherwise it switches the database to that mode,
+        which needs one full VACUUM to take effect.
+        '''
+        try:
+            conn = db_manager.get_thread_connection()
+            if conn.execute("PRAGMA auto_vacuum;").fetchone()[0] == 2:
+                # executescript steps the pragma to completion (execute frees a single page)
+                conn.executescript(f"PRAGMA incremental_vacuum({cls.INCREMENTAL_VACUUM_PAGES});")
+            else:
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL;")
+                conn.execute("VACUUM;")
+        except Exception as e:
+            Logger.error(f"Error reclaiming space in {db_manager.db_path}: {e}")
+
+    @staticmethod
+    def cleanup_tables(cleaners):
+        '''
+        Trim several tables, running the DELETEs for each database in one transaction.
+
+        Intended for the cleaners returned by select_needing_cleanup(): each
+        DELETE removes everything past the newest max_records rows directly,
+        so the tables are not COUNTed again after that probe. If a batch
+        fails it is rolled back and those cleaners fall back to
+        cleanup_table().
+
+        Returns:
+            dict: (db_path, table name) -> number of records deleted, summed
+            over cleaners that share a table
+        '''
+        groups = {}
+        for cleaner in cleaners:
+            groups.setdefault(cleaner.db_manager.db_path, []).append(cleaner)
+
+        deleted = {}
+        for group in groups.values():
+            db_manager = group[0].db_manager
+            try:
+                with db_manager.transaction() as conn:
+                    counts = [conn.execute(c._trim_sql).rowcount for c in group]
+                DatabaseCleaner._record_deletes(db_manager, sum(counts))
+            except Exception as e:
+                if __debug__:
+                    Logger.debug("Batched cleanup failed, cleaning tables individually: %s", e)
+                counts = [c.cleanup_table() for c in group]
+            for c, n in zip(group, counts):
+                key = (c.db_manager.db_path, c.table_name)
+                deleted[key] = deleted.get(key, 0) + n
+
+        return deleted
+
     def cleanup_table(self):
         '''
         Remove old records from the database table to maintain max_records limit.
         '''
         try:
             # Get the current count
-            count_query = f"SELECT COUNT(*) FROM {self.table_name};"
-            total_records = self.db_manager.execute_query(count_query)
+            total_records = self.db_manager.execute_query(self._count_sql)
             
             if total_records is None:
                 return 0  # No data or error
@@ -50,22 +206,11 @@ class DatabaseCleaner:
             # Number of records to delete
             to_delete = total_records - self.max_records
             
-            # Delete oldest records based on datetime column
-            # Assuming the table has an 'id' column and a 'datetime' column for sorting
-            delete_query = f"""
-                DELETE FROM {self.table_name}
-                WHERE id IN (
-                    SELECT id FROM {self.table_name}
-                    ORDER BY datetime ASC
-                    LIMIT {to_delete}
-                );
-            """
-            
             # Execute the delete query
-            self.db_manager.execute_query(delete_query)
+            self.db_manager.execute_query(self._delete_sql, (to_delete,))
             
-            # Optionally run VACUUM to reclaim disk space
-            self.db_manager.execute_query("VACUUM;")
+            # Reclaim disk space once enough rows have been deleted
+            self._record_deletes(self.db_manager, to_delete)
             
             return to_delete
         except Exception as e:
@@ -73,17 +218,18 @@ class DatabaseCleaner:
             import traceback
             Logger.error(traceback.format_exc())  # Log full stack trace for better debugging
             
-            # Debug info
-            Logger.debug("DB DEBUG INFO:")
-            Logger.debug(f"  Table: {self.table_name}")
-            Logger.debug(f"  Max records: {self.max_records}")
-            
-            # Try to get table schema
-            try:
-                schema_query = f"PRAGMA table_info({self.table_name});"
-                schema = self.db_manager.execute_query(schema_query, fetchall=True)
-                Logger.debug(f"  Table schema: {schema}")
-            except Exception as schema_error:
-                Logger.error(f"  Error getting schema: {schema_error}")
+            # Debug info (compiled out under `python -O`)
+            if __debug__:
+                Logger.debug("DB DEBUG INFO:")
+                Logger.debug("  Table: %s", self.table_name)
+                Logger.debug("  Max records: %s", self.max_records)
+                
+                # Try to get table schema
+                try:
+                    schema_query = f"PRAGMA table_info({self.table_name});"
+                    schema = self.db_manager.execute_query(schema_query, fetchall=True)
+                    Logger.debug("  Table schema: %s", schema)
+                except Exception as schema_error:
+                    Logger.error(f"  Error getting schema: {schema_error}")
                 
             return 0
@@ -4,7 +4,9 @@ Log archiver module for managing CSV log file rotation and archiving.
 
 # Standard imports
 import csv
+import mmap
 import os
+import time
 import zipfile
 from datetime import datetime
 from pathlib import Path
@@ -12,6 +14,14 @@ from pathlib import Path
 # Kivy imports
 from kivy.logger import Logger
 
+# Slice size used when counting newlines in the memory-mapped log
+COUNT_CHUNK_BYTES = 1 << 20
+
+# Suffix of a full log moved aside while its archive is being written
+STAGING_SUFFIX = '.archiving'
+# Wait after swapping in a fresh log before compressing the staged one
+STAGING_SETTLE_SECONDS = 0.5
+
 
 class LogArchiver:
     '''
@@ -33,6 +43,11 @@ class LogArchiver:
         else:
             self.max_lines = 1000
         
+        # Running average of bytes per line, learned from each full count.
+        # Used to skip the line count while the file is clearly too small.
+        self._avg_line_bytes = None
+        self._min_bytes_before_count = 0
+        
         # Ensure archive directory exists
         if not self.archive_dir.exists():
             self.archive_dir.mkdir(parents=True, exist_ok=True)
@@ -42,22 +57,84 @@ class LogArchiver:
         if not self.log_path.exists():
             return 0
             
-        with self.log_path.open('r', newline='') as f:
-            return sum(1 for _ in f)
+        with self.log_path.open('rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return 0  # mmap can't map an empty file
+            # Memory-map and count newlines in C (bytes.count) a chunk at a time
+            # rather than decoding and iterating lines in Python
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                lines = 0
+                for offset in range(0, size, COUNT_CHUNK_BYTES):
+                    lines += mm[offset:offset + COUNT_CHUNK_BYTES].count(b'\n')
+                # A final line without a trailing newline still counts
+                if mm[size - 1:size] != b'\n':
+                    lines += 1
+                return lines
     
+    def _update_size_gate(self, size, lines):
+        '''Update the bytes-per-line estimate and the size gate from a full count.'''
+        if lines <= 0:
+            return
+        sample = size / lines
+        if self._avg_line_bytes is None:
+            self._avg_line_bytes = sample
+        else:
+            self._avg_line_bytes = 0.8 * self._avg_line_bytes + 0.2 * sample
+        # Keep a 10% margin so a shift toward longer lines can't hide an overdue archive
+        self._min_bytes_before_count = int(self.max_lines * self._avg_line_bytes * 0.9)
+
     def archive_if_needed(self):
         '''Check if log needs archiving and archive if so.'''
-        # Check if the file exists and has more than max_lines
-        if not self.log_path.exists() or self.count_lines() <= self.max_lines:
+        try:
+            size = os.stat(self.log_path).st_size
+        except FileNotFoundError:
+            return False
+        
+        # Cheap gate: skip the full line count while the file is clearly under max_lines
+        if size < self._min_bytes_before_count:
+            return False
+        
+        line_count = self.count_lines()
+        self._update_size_gate(size, line_count)
+        if line_count <= self.max_lines:
             return False
             
         return self.archive_log()
     
+    def _zip_staged(self, staging_path, zip_path):
+        '''
+        Compress a staged log into zip_path and remove it.
+        On failure the partial zip is removed and the staged log is kept.
+        '''
+        try:
+            # ZipFile.write streams the source in fixed-size chunks
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                zipf.write(staging_path, arcname=self.log_path.name)
+        except Exception as e:
+            Logger.error(f"Error compressing {staging_path.name}, will retry: {e}")
+            try:
+                zip_path.unlink()
+            except FileNotFoundError:
+                pass
+            return False
+        staging_path.unlink()
+        return True
+    
+    def retry_staged(self):
+        '''Archive staged logs left behind by an interrupted or failed archive.'''
+        for staging_path in sorted(self.log_path.parent.glob('logfile_*' + STAGING_SUFFIX)):
+            zip_path = self.archive_dir / (staging_path.name[:-len(STAGING_SUFFIX)] + '.zip')
+            self._zip_staged(staging_path, zip_path)
+    
     def archive_log(self):
         '''
         Archive the current log file and create a new one with just headers.
         All archives are retained permanently.
         '''
+        # Finish any archive left staged by an earlier failure first
+        self.retry_staged()
+        
         try:
             # Read the log file to get first and last entry timestamps
             try:
@@ -119,15 +196,37 @@ class LogArchiver:
             timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
             zip_filename = f"logfile_{first_datetime}_to_{last_datetime}_{timestamp}.zip"
             zip_path = self.archive_dir / zip_filename
+            # Two archives within the same second must not share a staging file
+            suffix = 1
+            while zip_path.exists() or self.log_path.with_name(zip_path.stem + STAGING_SUFFIX).exists():
+                zip_path = self.archive_dir / f"{Path(zip_filename).stem}_{suffix}.zip"
+                suffix += 1
             
-            # Create the zip file
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                zipf.write(self.log_path, arcname=self.log_path.name)
-            
-            # Create a new log file with just headers
-            with self.log_path.open('w', newline='') as f:
+            # Swap in a fresh log before compressing. The full log is
+            # hard-linked to the staging name and a header-only file is then
+            # os.replace()d over logfile.csv, so the log path always exists
+            # and no append is clobbered by the header rewrite. The staging
+            # file is named after its zip, so a staged log that failed to
+            # compress is never overwritten and can be retried under the same
+            # archive name.
+            staging_path = self.log_path.with_name(zip_path.stem + STAGING_SUFFIX)
+            new_log_path = self.log_path.with_name(self.log_path.name + '.new')
+            with new_log_path.open('w', newline='') as f:
                 writer = csv.writer(f)
                 writer.writerow(headers)
+            try:
+                os.link(self.log_path, staging_path)
+            except OSError:
+                # No hard links on this filesystem: fall back to a rename
+                os.rename(self.log_path, staging_path)
+            os.replace(new_log_path, self.log_path)
+            
+            # Appends opened before the swap still go to the staged file; let
+            # them finish before it is compressed
+            time.sleep(STAGING_SETTLE_SECONDS)
+            
+            if not self._zip_staged(staging_path, zip_path):
+                return False
                 
             return True
         except Exception as e:
@@ -135,10 +234,11 @@ class LogArchiver:
             import traceback
             Logger.error(traceback.format_exc())  # Log full stack trace for better debugging
             
-            # Debug info
-            Logger.debug("LOG DEBUG INFO:")
-            Logger.debug(f"  Log path: {self.log_path} (exists: {self.log_path.exists()})")
-            Logger.debug(f"  Archive dir: {self.archive_dir} (exists: {self.archive_dir.exists()})")
-            if self.log_path.exists():
-                Logger.debug(f"  Log line count: {self.count_lines()}")
+            # Debug info (compiled out under `python -O`)
+            if __debug__:
+                Logger.debug("LOG DEBUG INFO:")
+                Logger.debug("  Log path: %s (exists: %s)", self.log_path, self.log_path.exists())
+                Logger.debug("  Archive dir: %s (exists: %s)", self.archive_dir, self.archive_dir.exists())
+                if self.log_path.exists():
+                    Logger.debug("  Log line count: %s", self.count_lines())
             return False
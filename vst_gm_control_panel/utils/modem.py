@@ -57,6 +57,7 @@ import re
 import signal
 import os
 
+from kivy.app import App
 from kivy.logger import Logger
 from kivy.clock import Clock
 
@@ -629,7 +630,10 @@ class SerialManager:
             # This is the ONLY overfill source — MCP23017 TLS pin read removed.
             if 'overfill' in data:
                 try:
-                    self.esp32_overfill = bool(int(data['overfill']))
+                    overfill = bool(int(data['overfill']))
+                    if overfill != self.esp32_overfill:
+                        self._bump_input_version()
+                    self.esp32_overfill = overfill
                 except (ValueError, TypeError):
                     pass  # Keep last good value
 
@@ -816,6 +820,12 @@ class SerialManager:
             self._log('error', f'Error receiving ESP32 status: {e}')
             return None
 
+    def _bump_input_version(self):
+        '''Tell the alarm manager an alarm input changed so its next sweep runs in full.'''
+        app = App.get_running_app()
+        if app is not None and hasattr(app, 'input_version'):
+            app.input_version += 1
+
     def is_passthrough_active(self):
         '''Check if ESP32 is currently in passthrough mode'''
         return self.esp32_passthrough == 1
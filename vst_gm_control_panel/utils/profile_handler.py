@@ -17,7 +17,7 @@ from .alarm_manager import (
     VariablePressureCondition, ZeroPressureCondition,
     OverfillCondition, DigitalStorageCondition,
     SeventyTwoHourCondition, AlarmCondition,
-    GMFaultCondition
+    GMFaultCondition, AlarmRepository
 )
 
 
@@ -55,6 +55,7 @@ class ProfileHandler:
         try:
             # Save profile to database
             self.app.user_db.add_setting('profile', profile)
+            AlarmRepository.invalidate_profile()
             
             # Update internal profile
             self.profile = profile
@@ -253,6 +253,7 @@ class AdjustmentsScreen(MDScreen):
             
             # Save to database
             self.app.thresholds_db.add_setting('vac_pump_fault_count', value)
+            self.app.alarm_manager.repository.invalidate_threshold('vac_pump_fault_count')
             
             pass
             
@@ -261,7 +262,7 @@ class AdjustmentsScreen(MDScreen):
                 self.app.user_defined_change()
                 
             # Force reload of alarm settings to apply new threshold
-            self.app.alarm_manager.check_alarms()
+            self.app.check_alarms(force=True)
                 
         elif self.current_interval_name == 'high_pressure_delay':
             # Update high pressure delay
@@ -316,7 +317,7 @@ class AdjustmentsScreen(MDScreen):
                 self.app.user_defined_change()
         
         # Force an immediate alarm check to apply the new delay
-        self.app.alarm_manager.check_alarms()
+        self.app.check_alarms(force=True)
         
         self.new_interval = 0
         self.current_sheet.set_state('toggle')
@@ -356,6 +357,7 @@ class AdjustmentsScreen(MDScreen):
         # Reset the vac pump fault count
         self.app.vac_failure_limit_string = '10'
         self.app.thresholds_db.add_setting('vac_pump_fault_count', 10)
+        self.app.alarm_manager.repository.invalidate_threshold('vac_pump_fault_count')
         self.vac_pump_fault_count = '10'
         
         # Reset the high pressure delay
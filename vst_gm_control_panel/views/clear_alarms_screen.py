@@ -48,6 +48,7 @@ class ClearAlarmsScreen(MDScreen):
         # Clear general alarm settings.
         self.app.gm_db.add_setting(f'{self.selected_alarm}_alarm', None)
         self.app.alarms_db.add_setting(f'{self.selected_alarm}_start_time', None)
+        self.app.alarm_manager.reload_alarm_states([self.selected_alarm])
         
         # Turn shutdown relay back on when alarm is cleared
         self.app.io.set_shutdown_relay(True)
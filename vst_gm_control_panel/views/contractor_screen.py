@@ -260,9 +260,11 @@ class ContractorScreen(MDScreen):
             'variable_pressure',
             'zero_pressure'
         ]
-        for alarm in pressure_alarms:
-            self.app.gm_db.add_setting(f'{alarm}_alarm', None)
-            self.app.alarms_db.add_setting(f'{alarm}_start_time', None)
+        # gm and alarms share app.db, so both batches commit together
+        with self.app.alarms_db.transaction():
+            self.app.gm_db.add_settings_many([(f'{alarm}_alarm', None) for alarm in pressure_alarms])
+            self.app.alarms_db.add_settings_many([(f'{alarm}_start_time', None) for alarm in pressure_alarms])
+        self.app.alarm_manager.reload_alarm_states()
         
         # Turn shutdown relay back on when alarms are cleared
         self.app.io.set_shutdown_relay(True)
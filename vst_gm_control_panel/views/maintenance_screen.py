@@ -46,6 +46,7 @@ class MaintenanceScreen(MDScreen):
         self.app.alarms_db.add_setting('vac_pump_start_time', None)
         self.app.alarms_db.add_setting('vac_pump_failure_count', None)
         self.app.gm_db.add_setting('vac_pump_alarm', None)
+        self.app.alarm_manager.reload_alarm_states(['vac_pump'])
         
         # Turn shutdown relay back on when vac pump alarm is cleared
         self.app.io.set_shutdown_relay(True)
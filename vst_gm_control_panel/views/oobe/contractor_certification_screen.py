@@ -47,13 +47,11 @@ class ContractorCertificationScreen(BaseOOBEScreen):
                 'certification_number_helper': 'Ingrese el número de certificación del contratista de inicio',
             }
             
-            # Add English translations
-            for key, value in english_translations.items():
-                self.app.translations_db.add_translation('EN', key, value)
-            
-            # Add Spanish translations
-            for key, value in spanish_translations.items():
-                self.app.translations_db.add_translation('ES', key, value)
+            # Add English and Spanish translations in one transaction
+            translations_db = self.app.translations_db
+            with translations_db.transaction():
+                translations_db.load_language_file('EN', english_translations)
+                translations_db.load_language_file('ES', spanish_translations)
                 
         except Exception as e:
             Logger.error(f'OOBE: Error adding contractor certification translations: {e}')
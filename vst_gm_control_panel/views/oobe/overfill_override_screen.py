@@ -144,6 +144,7 @@ class OOBEOverfillOverrideScreen(BaseOOBEScreen):
         self.app.alarms_db.add_setting('overfill_start_time', None)
         self.app.alarms_db.add_setting('last_overfill_time', None)
         self.app.gm_db.add_setting('overfill_alarm', None)
+        self.app.alarm_manager.repository.invalidate_cached_state()
         
         # Mark override as completed
         self.override_completed = True
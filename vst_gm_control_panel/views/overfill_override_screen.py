@@ -55,4 +55,5 @@ class OverfillOverrideScreen(MDScreen):
         '''
         self.app.alarms_db.add_setting('overfill_start_time', None)
         self.app.alarms_db.add_setting('last_overfill_time', None)
-        self.app.gm_db.add_setting('overfill_alarm', None)
\ No newline at end of file
+        self.app.gm_db.add_setting('overfill_alarm', None)
+        self.app.alarm_manager.repository.invalidate_cached_state()
\ No newline at end of file